@@ -1,10 +1,44 @@
 # from components.simulation_component import SimulationComponent
+import functools
+import importlib
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import entry_points
 
 from cs_fmu_mapper.components.master_component import MasterComponent
 from cs_fmu_mapper.components.simulation_component import SimulationComponent
 from cs_fmu_mapper.opcua_fmu_mapper import OPCUAFMUMapper
 
+# custom component classes resolved by previous factory calls, keyed by (module path, class name)
+_custom_component_cache: dict[tuple[str, str], type] = {}
+
+# entry point group under which installed packages can provide additional component classes
+COMPONENT_ENTRY_POINT_GROUP = "cs_fmu_mapper.components"
+
+
+@functools.lru_cache(maxsize=None)
+def _load_entry_point_components() -> dict[str, type]:
+    """Loads the component classes provided by installed packages through the "cs_fmu_mapper.components" entry point group.
+    The entry points are only discovered and imported once per process.
+
+    Returns:
+        dict[str, type]: The component classes by their type.
+    """
+    log = logging.getLogger(ComponentFactory.__name__)
+    component_classes = {}
+    for entry_point in entry_points(group=COMPONENT_ENTRY_POINT_GROUP):
+        try:
+            component_class = entry_point.load()
+            if not issubclass(component_class, SimulationComponent):
+                raise Exception(
+                    f"Component {entry_point.name} is not a subclass of SimulationComponent."
+                )
+            component_classes[component_class.type] = component_class
+        except Exception as e:
+            log.error(f"Error loading component entry point {entry_point.name}: {e}")
+    return component_classes
+
 
 class ComponentFactory:
     """Creates components that inherit from the SimulationComponent class and returns instances of that components with their corresponding configuration dictionary."""
@@ -28,12 +62,9 @@ class ComponentFactory:
         self._components = []
         self._master_component = None
 
-        classes = list(SimulationComponent.get_subclasses())
-        master_classes = list(MasterComponent.get_subclasses())
-
-        self._log.debug("Master classes: " + str(master_classes))
-
-        component_classes = {c.type: (c, None) for c in classes}
+        # copy the registry so that custom components do not leak into other factory calls
+        component_classes = dict(SimulationComponent._registry)
+        component_classes.update(_load_entry_point_components())
 
         # Import custom components from the "General" section of the config
         if "General" in config and "customComponents" in config["General"]:
@@ -42,54 +73,76 @@ class ComponentFactory:
                 component_path = component_info["pathToComponent"]
                 try:
                     # Add the custom component to the component_classes dictionary if it is a subclass of SimulationComponent
-                    exec(f"from {component_path} import {component_class_name}")
-                    component_class = eval(component_class_name)
+                    cache_key = (component_path, component_class_name)
+                    component_class = _custom_component_cache.get(cache_key)
+                    if component_class is None:
+                        module = importlib.import_module(component_path)
+                        component_class = getattr(module, component_class_name)
                     if not issubclass(component_class, SimulationComponent):
                         raise Exception(
                             f"Component {component_class_name} is not a subclass of SimulationComponent."
                         )
-                    component_classes[component_class.type] = (  # type: ignore
-                        component_class,
-                        None,
-                    )
+                    _custom_component_cache[cache_key] = component_class
+                    component_classes[component_class.type] = component_class  # type: ignore
 
                 except Exception as e:
                     self._log.error(
                         f"Error importing component {component_class_name}: {e}"
                     )
 
-        self._log.debug(list(component_classes.keys()))
+        self._log.debug("Registered component classes: %s", list(component_classes))
 
-        # Extract configuration sections with 'type' field declared -> presumably SimulationComponent's
-        componentConfig = {name: cfg for name, cfg in config.items() if "type" in cfg}
-
-        for name, cfg in componentConfig.items():
+        # Only configuration sections with a 'type' field declared are SimulationComponent's, skip all others (e.g. Mapping)
+        # All classes are resolved before anything is instantiated, so configuration errors are raised before any FMU is loaded
+        component_specs = []
+        for name, cfg in config.items():
+            if "type" not in cfg:
+                continue
             if cfg["type"] == "logger":
                 self._log.info(
                     "Component type 'logger' is deprecated and should be renamed to 'plotter'"
                 )
                 cfg["type"] = "plotter"
-            type = cfg["type"]
-            try:
-                cls, component_input = component_classes[type]
-                component_instance = cls(
-                    cfg,
-                    name,
-                    **component_input if component_input else {},
-                )
-                self._components.append(component_instance)
-                if cls in master_classes and self._master_component is None:
-                    self._master_component = component_instance
-                elif cls in master_classes and self._master_component:
-                    raise Exception("Multiple master components defined.")
-            except KeyError:
+            cls = component_classes.get(cfg["type"])
+            if cls is None:
                 raise NotImplementedError(
-                    f"Defined Component {name} of type {type} is not implemented."
+                    f"Defined Component {name} of type {cfg['type']} is not implemented."
                 )
-
-        if self._master_component is None:
+            component_specs.append((name, cfg, cls))
+
+        master_names = [
+            name for name, _, cls in component_specs if issubclass(cls, MasterComponent)
+        ]
+        if len(master_names) > 1:
+            raise Exception("Multiple master components defined.")
+        if not master_names:
             raise Exception("No master components defined.")
 
+        general = config["General"] if "General" in config else {}
+        parallel_init = general["parallelInit"] if "parallelInit" in general else False
+        instances = {}
+        other_specs = [spec for spec in component_specs if spec[0] != master_names[0]]
+        if parallel_init and len(other_specs) > 1:
+            # loading FMUs is mostly file and library I/O, the master is still built on the main thread
+            with ThreadPoolExecutor(
+                max_workers=min(len(other_specs), os.cpu_count() or 1)
+            ) as executor:
+                futures = {
+                    name: executor.submit(cls, cfg, name)
+                    for name, cfg, cls in other_specs
+                }
+                for name, cfg, cls in component_specs:
+                    if name == master_names[0]:
+                        instances[name] = cls(cfg, name)
+                for name, future in futures.items():
+                    instances[name] = future.result()
+        else:
+            for name, cfg, cls in component_specs:
+                instances[name] = cls(cfg, name)
+
+        self._components = [instances[name] for name, _, _ in component_specs]
+        self._master_component = instances[master_names[0]]
+
         mapper = OPCUAFMUMapper(
             config=config["Mapping"],
             master=self._master_component,
@@ -1,8 +1,60 @@
 import asyncio
 
 import asyncua.common
+import numpy as np
+from asyncua import ua
+from asyncua.client.ua_client import UASocketState
 from cs_fmu_mapper.components.simulation_component import SimulationComponent
 
+# Constant values written to the boolean utility nodes, created once instead of on every write
+_DV_TRUE_BOOL = ua.DataValue(ua.Variant(True, ua.VariantType.Boolean))
+_DV_FALSE_BOOL = ua.DataValue(ua.Variant(False, ua.VariantType.Boolean))
+
+# Initial poll interval in seconds when the step handshake is polled instead of subscribed
+_MIN_POLL_INTERVAL = 0.0001
+
+# Indices of the step evaluation counters. Single and full step counters are laid out identically, the offset
+# of the classification (correct, too large, too small) is added to the base index of the respective counter group.
+_SINGLE_STEP = 0
+_FULL_STEP = 3
+_CORRECT = 0
+_TOO_LARGE = 1
+_TOO_SMALL = 2
+
+
+class _StepHandshakeHandler:
+    """Subscription handler that caches the latest values of the step and time node of an external OPCUA server."""
+
+    def __init__(self, step_node_id: ua.NodeId, time_node_id: ua.NodeId) -> None:
+        self._step_node_id = step_node_id
+        self._time_node_id = time_node_id
+        self.step_value = None
+        self.time_value = None
+        self.changed = asyncio.Event()
+
+    def datachange_notification(self, node, val, data):
+        """Invoked by asyncua whenever the server publishes a new value of a subscribed node."""
+        if node.nodeid == self._step_node_id:
+            self.step_value = val
+        elif node.nodeid == self._time_node_id:
+            self.time_value = val
+        self.changed.set()
+
+    async def wait_for_step(self, start_time: float):
+        """Wait until the server reset the step node and advanced its time beyond the given start time. This is the same condition the
+        polled handshake uses, the set step node itself may never be published if the server resets it within one publishing interval.
+
+        Args:
+            start_time (float): Server time before the step was triggered.
+        """
+        while not (
+            self.step_value == False
+            and self.time_value is not None
+            and self.time_value > start_time
+        ):
+            self.changed.clear()
+            await self.changed.wait()
+
 
 class ExternalOPCUAClient(SimulationComponent):
     type = "external_opcua_client"
@@ -20,6 +72,7 @@ class ExternalOPCUAClient(SimulationComponent):
         super(ExternalOPCUAClient, self).__init__(config, name)
         self._host = config["host"]
         self._port = config["port"]
+        self._url = f"opc.tcp://{self._host}:{self._port}/"
         self._step_node_name = config["stepNodeName"]
         self._terminate_node_name = config["terminateNodeName"]
         self._run_node_name = config["runNodeName"]
@@ -35,30 +88,46 @@ class ExternalOPCUAClient(SimulationComponent):
         self._connect_timeout = (
             config["connectRetryInterval"] if "connectRetryInterval" in config else 10
         )
+        self._use_subscription = (
+            config["useSubscription"] if "useSubscription" in config else False
+        )
+        self._subscription_period = (
+            config["subscriptionPeriod"] if "subscriptionPeriod" in config else 10
+        )
+        self._step_timeout = config["stepTimeout"] if "stepTimeout" in config else 60
         self._connection: asyncua.Client | None = None
+        self._is_connected = False
+        self._subscription = None
+        self._step_handler: _StepHandshakeHandler | None = None
         self._nodes = {}
         self._running = False
         self._lock = lock
         self._names_id_map = {}
-
-        self._wrong_step_counter = 0
-        self._correct_step_counter = 0
-        self._too_large_ts_counter = 0
-        self._correct_full_step_counter = 0
-        self._false_full_step_counter = 0
-        self._too_large_full_step_counter = 0
+        self._input_node_ids = {}
+        self._output_node_ids = {}
+        self._input_keys: tuple[str, ...] = ()
+        self._input_write_params = ua.WriteParameters()
+        self._output_keys: tuple[str, ...] = ()
+        self._output_read_params = ua.ReadParameters()
+        self._step_node = None
+        self._time_node = None
+        self._terminate_node = None
+        self._run_node = None
+        self._enable_stop_time_node = None
+
+        self._step_counters = np.zeros(6, dtype=np.int64)
 
     async def _connect(self):
         """Connects client to OPCUA Server if it isn't already connected."""
-        if not self.is_connected():
-            self._log.info(
-                "Connecting to OPCUA Server at " + self._host + ":" + self._port + "/"
-            )
-            self._connection = asyncua.Client(
-                url="opc.tcp://" + self._host + ":" + self._port + "/"
-            )
+        if not self.is_connected_slow():
+            self._log.info("Connecting to OPCUA Server at %s", self._url)
+            # a fresh client is created on every (re)connect, subscriptions of a previous session are gone
+            self._connection = asyncua.Client(url=self._url)
+            self._subscription = None
+            self._step_handler = None
+            self._is_connected = False
             _retries = 0
-            while not self.is_connected() and _retries < self._max_connect_retries:
+            while not self._is_connected and _retries < self._max_connect_retries:
                 try:
                     if _retries > 0:
                         self._log.info(
@@ -67,6 +136,7 @@ class ExternalOPCUAClient(SimulationComponent):
                     else:
                         self._log.info("Connecting to OPCUA Server...")
                     await self._connection.connect()
+                    self._is_connected = True
                 except Exception as e:
                     self._log.info(f"Failed to connect to OPCUA Server: {e}")
                     await asyncio.sleep(self._connect_timeout)
@@ -79,8 +149,13 @@ class ExternalOPCUAClient(SimulationComponent):
 
     async def _disconnect(self):
         """Disconnects client from OPCUA Server if it is connected."""
-        if self.is_connected():
+        if self.is_connected_slow():
+            if self._subscription is not None:
+                await self._subscription.delete()
+                self._subscription = None
+                self._step_handler = None
             await self._connection.disconnect()
+            self._is_connected = False
             self._log.info("Client disconnected.")
         else:
             self._log.info("Client already disconnected.")
@@ -91,11 +166,8 @@ class ExternalOPCUAClient(SimulationComponent):
         Args:
             enable_stop_time (bool): Value to set the enableStopTime node to.
         """
-        enable_stop_time_node = self._connection.get_node(
-            self._names_id_map[self._enable_stop_time_node_name]
-        )
-        await enable_stop_time_node.write_value(
-            enable_stop_time, asyncua.ua.uatypes.VariantType.Boolean
+        await self._enable_stop_time_node.write_attribute(
+            ua.AttributeIds.Value, _DV_TRUE_BOOL if enable_stop_time else _DV_FALSE_BOOL
         )
 
     async def get_enable_stop_time(self) -> bool:
@@ -104,10 +176,7 @@ class ExternalOPCUAClient(SimulationComponent):
         Returns:
             bool: Value of the enableStopTime node.
         """
-        enable_stop_time_node = self._connection.get_node(
-            self._names_id_map[self._enable_stop_time_node_name]
-        )
-        return await enable_stop_time_node.read_value()
+        return await self._enable_stop_time_node.read_value()
 
     async def get_time(self) -> float:
         """Read the value of the time node.
@@ -115,65 +184,123 @@ class ExternalOPCUAClient(SimulationComponent):
         Returns:
             float: Value of the time node.
         """
-        time_node = self._connection.get_node(self._names_id_map[self._time_node_name])
-        return await time_node.read_value()
+        return await self._time_node.read_value()
 
     async def terminate(self):
         """Initiate termination without catching an exception."""
         self._log.info("Terminating OPCUA Client...")
-        terminate_node = self._connection.get_node(
-            self._names_id_map[self._terminate_node_name]
-        )
-        await terminate_node.write_value(True, asyncua.ua.uatypes.VariantType.Boolean)
-
         try:
-            await self._do_single_step()
+            # the server may not answer the step anymore once terminated, so do not wait forever
+            await asyncio.wait_for(
+                self._do_single_step(terminate=True), self._connect_timeout
+            )
         except:
             pass
         self._log.info("OPCUA client terminated.")
 
     def is_connected(self):
-        """Check if Client is connected.
+        """Check if Client is connected. The state is cached by connect and disconnect so that this check is cheap enough for the step loop,
+        use is_connected_slow() to query the state of the underlying protocol.
+
+        Returns:
+            bool: return true if client is connected, false if client is not connected
+        """
+        return self._is_connected
+
+    def is_connected_slow(self):
+        """Check if Client is connected by querying the state of the underlying protocol. Updates the cached connection state.
 
         Returns:
             bool: return true if client is connected, false if client is not connected
         """
         if self._connection == None:
-            return False
+            self._is_connected = False
         elif self._connection.uaclient.protocol == None:
-            return False
-        elif self._connection.uaclient.protocol.state == "open":
-            return True
+            self._is_connected = False
+        elif self._connection.uaclient.protocol.state == UASocketState.OPEN:
+            self._is_connected = True
         else:
             self._log.debug(self._connection.uaclient.protocol.state)
-            return False
+            self._is_connected = False
+        return self._is_connected
 
     async def _map_nodeIDs_to_nodeNames(self, node_names: list[str]) -> dict[str, str]:
         """Create a map where each a nodeID is mapped to a list of given node names (browse names). This is important because usually the browse name
         of the node is known but the nodeID is needed to access the node on the OPCUA server. NodeIDs are formatted as for example "ns=1;i=1001",
         where "ns=1" is referred to the NamespaceIndex and "i=1001" as Identifier. The browse name is the name of the node, e.g. "room1.temperature".
 
+        The address space below the Objects folder is traversed level by level. All nodes of one level are browsed with a single Browse
+        request whose reference descriptions already contain the browse names, so no additional read per node is necessary.
+
         Args:
             node_names (list[str]): List of node names to map to nodeIDs.
 
         Returns:
             dict: Dictionary with browse names as keys and nodeIDs as values.
         """
+        missing = set(node_names)
+        names_id_map = {}
+        visited = {self._connection.nodes.objects.nodeid}
+        level = [self._connection.nodes.objects.nodeid]
+        while level and missing:
+            next_level = []
+            for reference in await self._browse_children(level):
+                node_id = reference.NodeId
+                if node_id in visited:
+                    continue
+                visited.add(node_id)
+                next_level.append(node_id)
+                browse_name = reference.BrowseName.Name
+                if browse_name in missing:
+                    names_id_map[browse_name] = (
+                        f"ns={node_id.NamespaceIndex};i={node_id.Identifier}"
+                    )
+                    missing.discard(browse_name)
+            level = next_level
+        return names_id_map
+
+    async def _browse_children(self, node_ids: list) -> list:
+        """Browse the hierarchical children of all given nodes with a single Browse request.
 
-        node_List = await asyncua.common.ua_utils.get_node_children(
-            self._connection.nodes.objects
-        )
-        browse_names = []
-        node_ids = []
-        for node in node_List:
-            browse_name = (await node.read_browse_name()).Name
-            identifier = node.nodeid.Identifier
-            namespace_index = node.nodeid.NamespaceIndex
-            if browse_name in node_names:
-                node_id = f"ns={namespace_index};i={identifier}"
-                browse_names.append(browse_name)
-                node_ids.append(node_id)
-        return {k: v for k, v in zip(browse_names, node_ids)}
+        Args:
+            node_ids (list[ua.NodeId]): NodeIDs of the nodes to browse.
+
+        Returns:
+            list[ua.ReferenceDescription]: Reference descriptions of all children of the given nodes.
+        """
+        params = ua.BrowseParameters()
+        params.View = ua.ViewDescription()
+        params.RequestedMaxReferencesPerNode = 0
+        params.NodesToBrowse = [
+            ua.BrowseDescription(
+                NodeId=node_id,
+                BrowseDirection=ua.BrowseDirection.Forward,
+                ReferenceTypeId=ua.NodeId(ua.ObjectIds.HierarchicalReferences),
+                IncludeSubtypes=True,
+                NodeClassMask=ua.NodeClass.Unspecified,
+                ResultMask=ua.BrowseResultMask.All,
+            )
+            for node_id in node_ids
+        ]
+        results = await self._connection.uaclient.browse(params)
+
+        references = []
+        continuation_points = []
+        for result in results:
+            references.extend(result.References)
+            if result.ContinuationPoint:
+                continuation_points.append(result.ContinuationPoint)
+        # the server may split large results, fetch the remaining references batched as well
+        while continuation_points:
+            next_params = ua.BrowseNextParameters()
+            next_params.ContinuationPoints = continuation_points
+            next_params.ReleaseContinuationPoints = False
+            continuation_points = []
+            for result in await self._connection.uaclient.browse_next(next_params):
+                references.extend(result.References)
+                if result.ContinuationPoint:
+                    continuation_points.append(result.ContinuationPoint)
+        return references
 
     async def connect(self):
         """Connect to OPCUA Server and initialize node maps."""
@@ -181,59 +308,178 @@ class ExternalOPCUAClient(SimulationComponent):
         self._log.debug("Connecting to OPCUA Client...")
         await self._connect()
 
-        # Create a mappping of node names (inputs, outputs, utility nodes) to node IDs
-        input_values_node_names = [
-            self.get_node_by_name(name) for name in self.get_input_values().keys()
+        # Create a mappping of node names (inputs, outputs, utility nodes) to node IDs. The mapping only depends on the address space
+        # of the server, so it is kept when reconnecting.
+        if not self._names_id_map:
+            input_values_node_names = [
+                self.get_node_by_name(name) for name in self.get_input_values().keys()
+            ]
+            output_values_node_names = [
+                self.get_node_by_name(name) for name in self.get_output_values().keys()
+            ]
+            all_node_names = input_values_node_names + output_values_node_names
+
+            # add utility nodes to input values
+            all_node_names.append(self._step_node_name)
+            all_node_names.append(self._terminate_node_name)
+            all_node_names.append(self._run_node_name)
+            all_node_names.append(self._enable_stop_time_node_name)
+            all_node_names.append(self._time_node_name)
+
+            self._names_id_map = await self._map_nodeIDs_to_nodeNames(all_node_names)
+
+        # Resolve the utility nodes once instead of on every access
+        self._step_node = self._connection.get_node(
+            self._names_id_map[self._step_node_name]
+        )
+        self._time_node = self._connection.get_node(
+            self._names_id_map[self._time_node_name]
+        )
+        self._terminate_node = self._connection.get_node(
+            self._names_id_map[self._terminate_node_name]
+        )
+        self._run_node = self._connection.get_node(
+            self._names_id_map[self._run_node_name]
+        )
+        self._enable_stop_time_node = self._connection.get_node(
+            self._names_id_map[self._enable_stop_time_node_name]
+        )
+
+        # Resolve the input and output nodes once so that they can be written and read with a single request per step
+        self._input_node_ids = {
+            key: self._names_id_map[self.get_node_by_name(key)]
+            for key in self.get_input_values().keys()
+        }
+        self._output_node_ids = {
+            key: self._names_id_map[self.get_node_by_name(key)]
+            for key in self.get_output_values().keys()
+        }
+        # the key order is fixed after connecting, only the values change between steps
+        self._input_keys = tuple(self._input_node_ids.keys())
+        self._output_keys = tuple(self._output_node_ids.keys())
+        # the request parameters are built once, per step only the written values are exchanged
+        self._input_write_params = ua.WriteParameters()
+        self._input_write_params.NodesToWrite = [
+            ua.WriteValue(
+                NodeId=self._connection.get_node(node_id).nodeid,
+                AttributeId=ua.AttributeIds.Value,
+            )
+            for node_id in self._input_node_ids.values()
         ]
-        output_values_node_names = [
-            self.get_node_by_name(name) for name in self.get_output_values().keys()
+        self._output_read_params = ua.ReadParameters()
+        self._output_read_params.NodesToRead = [
+            ua.ReadValueId(
+                NodeId=self._connection.get_node(node_id).nodeid,
+                AttributeId=ua.AttributeIds.Value,
+            )
+            for node_id in self._output_node_ids.values()
         ]
-        all_node_names = input_values_node_names + output_values_node_names
-
-        # add utility nodes to input values
-        all_node_names.append(self._step_node_name)
-        all_node_names.append(self._terminate_node_name)
-        all_node_names.append(self._run_node_name)
-        all_node_names.append(self._enable_stop_time_node_name)
-        all_node_names.append(self._time_node_name)
 
-        self._names_id_map = await self._map_nodeIDs_to_nodeNames(all_node_names)
+        if self._use_subscription and self._subscription is None:
+            await self._subscribe_step_handshake()
 
         if self._enable_stop_time:
             self._log.info("Disabling stop time...")
             await self.set_enable_stop_time(self._enable_stop_time)
 
-        self._log.info(
-            f"Connection established with OPCUA Server at {self._host}:{self._port}"
-        )
+        self._log.info("Connection established with OPCUA Server at %s", self._url)
         self._log.debug(
-            f"Node initialization completed with mapping from names to node IDs as follows: {self._names_id_map}"
+            "Node initialization completed with mapping from names to node IDs as follows: %s",
+            self._names_id_map,
+        )
+
+    async def _subscribe_step_handshake(self):
+        """Subscribe to the step and time node so that the completion of a step is pushed by the server instead of being polled."""
+        self._step_handler = _StepHandshakeHandler(
+            self._step_node.nodeid, self._time_node.nodeid
         )
+        self._subscription = await self._connection.create_subscription(
+            self._subscription_period, self._step_handler
+        )
+        # only the latest values are of interest, as with most servers a set and reset within one publishing interval is not reported
+        await self._subscription.subscribe_data_change(
+            [self._step_node, self._time_node], queuesize=1
+        )
+        self._log.debug("Subscribed to step and time node.")
 
     async def run(self) -> None:
+        """Start the external simulation within a session of its own which is closed afterwards. To start the simulation and step it
+        within a single session, use the client as async context manager and write the run node from there."""
+        async with self:
+            try:
+                await self._run_node.write_attribute(
+                    ua.AttributeIds.Value, _DV_TRUE_BOOL
+                )
+            except (asyncio.CancelledError, KeyboardInterrupt):
+                self._log.info("Canceling OPCUA Client...")
+                await self.finalize()
+                self._log.info("OPCUA Client has been cancelled.")
+
+    async def close(self):
+        """Close the session to the OPCUA Server."""
+        await self._disconnect()
+
+    async def __aenter__(self):
+        """Open the session to the OPCUA Server once, it is kept until the context is left."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _do_single_step(
+        self, start_time: float | None = None, terminate: bool = False
+    ) -> float:
+        """Perform a single step of the simulation. The step_size is determined by the external OPCUA server.
+
+        Args:
+            start_time (float, optional): Time of the server before the step if already known. Read from the server if not given.
+            terminate (bool, optional): Set the terminate node within the same write request that triggers the step. Defaults to False.
+
+        Returns:
+            float: Time of the server after the step.
+        """
+        if start_time is None:
+            start_time = await self.get_time()
+        if terminate:
+            await self._write_many(
+                [self._terminate_node, self._step_node], [_DV_TRUE_BOOL, _DV_TRUE_BOOL]
+            )
+        else:
+            await self._step_node.write_attribute(ua.AttributeIds.Value, _DV_TRUE_BOOL)
+        # wait until the step is finished, a server which does not answer the step must not block the simulation forever
         try:
-            run_node = self._connection.get_node(
-                self._names_id_map[self._run_node_name]
+            return await asyncio.wait_for(
+                self._wait_for_step(start_time), self._step_timeout
             )
-            await run_node.write_value(True, asyncua.ua.uatypes.VariantType.Boolean)
-        except (asyncio.CancelledError, KeyboardInterrupt):
-            self._log.info("Canceling OPCUA Client...")
-            await self.finalize()
-        await self._disconnect()
-        self._log.info("OPCUA Client has been cancelled.")
-
-    async def _do_single_step(self):
-        """Perform a single step of the simulation. The step_size is determined by the external OPCUA server."""
-        step_node = self._connection.get_node(self._names_id_map[self._step_node_name])
-        start_time = await self.get_time()
-        await step_node.write_value(True, asyncua.ua.uatypes.VariantType.Boolean)
-        # wait until the step is finished
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"External OPCUA server did not finish the step within {self._step_timeout}s."
+            ) from None
+
+    async def _wait_for_step(self, start_time: float) -> float:
+        """Wait until the server reset the step node and advanced its time beyond the given start time.
+
+        Args:
+            start_time (float): Time of the server before the step.
+
+        Returns:
+            float: Time of the server after the step.
+        """
+        if self._step_handler is not None:
+            await self._step_handler.wait_for_step(start_time)
+            return self._step_handler.time_value
+        # back off exponentially so that slow steps do not flood the server with reads and starve other tasks
+        poll_interval = _MIN_POLL_INTERVAL
+        max_poll_interval = max(_MIN_POLL_INTERVAL, self._step_size / 10)
         while True:
-            value = await step_node.read_value()
-            if value == False and await self.get_time() > start_time:
-                break
-            else:
-                await asyncio.sleep(0.000001)
+            value = await self._step_node.read_value()
+            if value == False:
+                server_time = await self.get_time()
+                if server_time > start_time:
+                    return server_time
+            await asyncio.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, max_poll_interval)
 
     async def do_step(self, t=None, dt=None):
         """Perform a simulation step. One step consists of multiple single steps, where the number of single steps is described by the steps_per_cycle class attribute.
@@ -254,70 +500,60 @@ class ExternalOPCUAClient(SimulationComponent):
 
         self._log.debug("Stepping Simulation")
 
+        target_time = t + dt
+        step_size = self._step_size
+        step_counters = self._step_counters
         server_time = await self.get_time()
+        now = server_time
         # Workaround because not every step call performs a step
-        while (await self.get_time()) < (t + dt):
-            await self._do_single_step()
-            if await self.get_time() == server_time + self._step_size:
-                self._correct_step_counter += 1
-            elif await self.get_time() > server_time + self._step_size:
-                self._too_large_ts_counter += 1
-            else:
-                self._wrong_step_counter += 1
-            server_time = await self.get_time()
-
-        if await self.get_time() == t + dt:
-            self._correct_full_step_counter += 1
-        elif await self.get_time() > t + dt:
-            self._too_large_full_step_counter += 1
-        else:
-            self._false_full_step_counter += 1
+        while now < target_time:
+            # the time after the step is returned by the step itself, no further reads are necessary
+            now = await self._do_single_step(server_time)
+            step_counters[
+                _SINGLE_STEP + self._classify_step(now, server_time + step_size)
+            ] += 1
+            server_time = now
+
+        step_counters[_FULL_STEP + self._classify_step(now, target_time)] += 1
 
         await self._read_output_values()
 
+    @staticmethod
+    def _classify_step(time: float, expected_time: float) -> int:
+        """Classify the server time after a step compared to the expected time.
+
+        Returns:
+            int: Offset of the matching step evaluation counter (_CORRECT, _TOO_LARGE or _TOO_SMALL).
+        """
+        if time == expected_time:
+            return _CORRECT
+        return _TOO_LARGE if time > expected_time else _TOO_SMALL
+
     def print_step_debug_evaluation(self):
         "Print statistics of how many steps were performed correctly, too large or too small."
 
         print()
         print("----- [DEBUG] Step evaluation -----")
-        total_steps = (
-            self._wrong_step_counter
-            + self._too_large_ts_counter
-            + self._correct_step_counter
-        )
-        print()
-        print(f"Total single steps performed: {total_steps}")
-        print(
-            f"Too small single steps: {self._wrong_step_counter}, ratio to total steps: {round((self._wrong_step_counter / total_steps)*100,2)} %"
-        )
-        print(
-            f"Too large single steps: {self._too_large_ts_counter}, ratio to total steps: {round((self._too_large_ts_counter / total_steps)*100,2)} %"
-        )
-        print(
-            f"Total wrong single steps: {self._wrong_step_counter + self._too_large_ts_counter}, ratio to total steps: {round(((self._wrong_step_counter + self._too_large_ts_counter) / total_steps)*100,2)} %"
-        )
-        print(
-            f"Correct single steps: {self._correct_step_counter}, ratio to total steps: {round((self._correct_step_counter / total_steps)*100,2)} %"
-        )
-        print()
-        total_full_steps = (
-            self._correct_full_step_counter
-            + self._too_large_full_step_counter
-            + self._false_full_step_counter
-        )
-        print(f"Total full steps performed: {total_full_steps}")
-        print(
-            f"Too small full steps: {self._false_full_step_counter}, ratio to total steps: {round((self._false_full_step_counter / total_full_steps)*100,2)} %"
-        )
-        print(
-            f"Too large full steps: {self._too_large_full_step_counter}, ratio to total steps: {round((self._too_large_full_step_counter / total_full_steps)*100,2)} %"
-        )
-        print(
-            f"Total wrong full steps: {self._false_full_step_counter + self._too_large_full_step_counter}, ratio to total steps: {round(((self._false_full_step_counter + self._too_large_full_step_counter) / total_full_steps)*100,2)} %"
-        )
-        print(
-            f"Correct full steps: {self._correct_full_step_counter}, ratio to total steps: {round((self._correct_full_step_counter / total_full_steps)*100,2)} %"
-        )
+        counters = self._step_counters.tolist()
+        for base, label in ((_SINGLE_STEP, "single"), (_FULL_STEP, "full")):
+            correct = counters[base + _CORRECT]
+            too_large = counters[base + _TOO_LARGE]
+            too_small = counters[base + _TOO_SMALL]
+            total = correct + too_large + too_small
+            print()
+            print(f"Total {label} steps performed: {total}")
+            print(
+                f"Too small {label} steps: {too_small}, ratio to total steps: {round((too_small / total)*100,2)} %"
+            )
+            print(
+                f"Too large {label} steps: {too_large}, ratio to total steps: {round((too_large / total)*100,2)} %"
+            )
+            print(
+                f"Total wrong {label} steps: {too_small + too_large}, ratio to total steps: {round(((too_small + too_large) / total)*100,2)} %"
+            )
+            print(
+                f"Correct {label} steps: {correct}, ratio to total steps: {round((correct / total)*100,2)} %"
+            )
         print()
         print("----- -----")
         print()
@@ -326,29 +562,52 @@ class ExternalOPCUAClient(SimulationComponent):
         """Reset the simulation by setting the time to 0."""
         # TODO A reset functionality would be nice because starting the opcua server is time consuming
         # TODO Not sure if this is possible because it seems like time cannot be resetted
-        # time_node = self._connection.get_node(self._names_id_map[self._time_node_name])
-        # await time_node.write_value(0.0, asyncua.ua.uatypes.VariantType.Float)
+        # await self._time_node.write_value(0.0, asyncua.ua.uatypes.VariantType.Float)
         pass
 
     async def _set_input_values(self):
-        """Set input values from class attribute to OPCUA server."""
-        for key, val in self.get_input_values().items():
-            node_name = self.get_node_by_name(key)
-            node = self._connection.get_node(self._names_id_map[node_name])
+        """Set input values from class attribute to OPCUA server with a single write request."""
+        input_values = self._input_values
+        params = self._input_write_params
+        for key, write_value in zip(self._input_keys, params.NodesToWrite):
+            val = input_values[key]
             self._log.debug(
-                f"Set Node with name '{key}' and node id '{self._names_id_map[node_name]}' to value '{val}'"
+                "Set Node with name '%s' and node id '%s' to value '%s'",
+                key,
+                self._input_node_ids[key],
+                val,
             )
-            await node.write_value(val, asyncua.ua.uatypes.VariantType.Float)
+            write_value.Value = ua.DataValue(ua.Variant(val, ua.VariantType.Float))
+        for status in await self._connection.uaclient.write(params):
+            status.check()
+
+    async def _write_many(self, nodes: list, values: list[ua.DataValue]):
+        """Write the values of multiple nodes with a single write request. The values are written in the given order.
+
+        Args:
+            nodes (list[asyncua.Node]): Nodes to write.
+            values (list[ua.DataValue]): Values to write, one per node.
+        """
+        params = ua.WriteParameters()
+        params.NodesToWrite = [
+            ua.WriteValue(NodeId=node.nodeid, AttributeId=ua.AttributeIds.Value, Value=value)
+            for node, value in zip(nodes, values)
+        ]
+        for status in await self._connection.uaclient.write(params):
+            status.check()
 
     async def _read_output_values(self):
-        """Read output values from OPCUA server and set them to class attribute."""
-        for key in self.get_output_values().keys():
-            node_name = self.get_node_by_name(key)
-            node = self._connection.get_node(self._names_id_map[node_name])
-            val = await node.read_value()
+        """Read output values from OPCUA server with a single read request and set them to class attribute."""
+        results = await self._connection.uaclient.read(self._output_read_params)
+        for key, result in zip(self._output_keys, results):
+            result.StatusCode.check()
+            val = result.Value.Value
             self._output_values[key] = val
             self._log.debug(
-                f"Read value '{val}' from node '{node_name}' with node id '{self._names_id_map[node_name]}'"
+                "Read value '%s' for '%s' from node id '%s'",
+                val,
+                key,
+                self._output_node_ids[key],
             )
 
     async def finalize(self):
@@ -359,6 +618,10 @@ class ExternalOPCUAClient(SimulationComponent):
             self.set_is_finished(True)
         except:
             pass
+        try:
+            await self.close()
+        except:
+            pass
 
     async def initialize(self):
         """Invoked by mapper instance before first do_step call."""
@@ -1,15 +1,24 @@
+import atexit
+import functools
 import logging
 import os
+import shutil
 from abc import ABC, abstractmethod
+from ctypes import (
+    POINTER,
+    c_double,
+    c_float,
+    c_int,
+    c_int32,
+    c_int64,
+    c_size_t,
+    c_uint32,
+    c_void_p,
+)
 
 import numpy as np
-import pyfmi.fmi as fmi
 from cs_fmu_mapper.components.simulation_component import SimulationComponent
-from cs_fmu_mapper.utils import chooseFile
-from fmpy.fmi2 import FMU2Slave
-from fmpy.fmi3 import FMU3Slave
-from fmpy import extract, read_model_description
-from pyfmi import load_fmu
+from cs_fmu_mapper.utils import resolveFile
 
 
 class FMUSimClient(SimulationComponent):
@@ -29,16 +38,11 @@ class FMUSimClient(SimulationComponent):
         """
         super(FMUSimClient, self).__init__(config, name)
         self._log.info("Loading FMU...")
-        if os.path.exists(config["path"]):
-            if os.path.isfile(config["path"]):
-                path = config["path"]
-            elif os.path.isdir(config["path"]):
-                file = chooseFile(
-                    config["path"], "FMU path is a directory. Please choose a FMU:"
-                )
-                path = config["path"] + "/" + file
-        else:
-            raise FileNotFoundError("FMU not found at: " + config["path"])
+        path = resolveFile(
+            config["path"],
+            "FMU path is a directory. Please choose a FMU:",
+            "FMU not found at: " + config["path"],
+        )
         self._fmi_version = ""
         self._model = self._load_model(path)
 
@@ -46,6 +50,23 @@ class FMUSimClient(SimulationComponent):
         self._step_size = config["stepSize"]
         # self._steps_per_cycle = config["numberOfStepsPerCycle"]
 
+        # resolve the node ids once so that the step loop does not walk the config on every variable
+        self._input_refs = [
+            (key, self.get_node_by_name(key)) for key in self._input_values
+        ]
+        self._output_refs = [
+            (key, self.get_node_by_name(key)) for key in self._output_values
+        ]
+        # the step does not await anything, unless a subclass overrides do_step the mapper can call it synchronously
+        self._blocking_step = type(self).do_step is FMUSimClient.do_step
+        # source or sink only FMUs skip the corresponding transfer entirely
+        self._has_inputs = bool(self._input_refs)
+        self._has_outputs = bool(self._output_refs)
+        # number of FMU steps and the specialized step loop for the last seen dt, see do_step_blocking
+        self._last_dt = None
+        self._n_substeps = 0
+        self._run_steps = None
+
         self._init_model()
         self._log.info("Finished Initialization of Sim Client.")
 
@@ -65,9 +86,9 @@ class FMUSimClient(SimulationComponent):
     def _read_output_values(self):
         pass
 
-    @abstractmethod
-    def _call_fmu_step(self):
-        pass
+    def _call_fmu_step(self, t, dt):
+        """Performs a single FMU step. Used by the default _specialize_steps, subclasses which bind their own step loop do not need it."""
+        raise NotImplementedError
 
     async def do_step(self, t: float, dt: float):
         """Triggers the configured amount of steps per cycle each
@@ -76,36 +97,314 @@ class FMUSimClient(SimulationComponent):
             t (float): The current communication point (current time) of the master.
             dt (float, optional): Step size for a step including the steps per cycle. The step size for a single step is therefore dt/steps_per_cycle.
         """
+        self.do_step_blocking(t, dt)
+
+    def do_step_blocking(self, t: float, dt: float):
+        """Synchronous implementation of do_step. Stepping the FMU does not await anything, so this can also run in a worker thread.
 
-        self._log.debug("Setting FMU Input")
-        self._set_input_values()
+        Args:
+            t (float): The current communication point (current time) of the master.
+            dt (float): Step size for a step including the steps per cycle.
+        """
+        debug = self._log.isEnabledFor(logging.DEBUG)
+        if self._has_inputs:
+            if debug:
+                self._log.debug("Setting FMU Input")
+            self._set_input_values()
+
+        if debug:
+            self._log.debug("Stepping Simulation")
+        # dt is usually constant over a run, so the step loop is only specialized again if it changes
+        if dt != self._last_dt:
+            self._n_substeps = self._steps_per_cycle(dt)
+            self._run_steps = self._specialize_steps(self._n_substeps)
+            self._last_dt = dt
+        self._run_steps(t)
+
+        if self._has_outputs:
+            if debug:
+                self._log.debug("Reading Simulation Output.")
+            self._read_output_values()
+
+    def _steps_per_cycle(self, dt: float) -> int:
+        """Returns the number of FMU steps which advance the FMU by dt.
 
-        self._log.debug("Stepping Simulation")
-        assert (
-            dt % self._step_size == 0
-        ), f"timeStepPerCycle must be a multiple of StepSize. StepSize: {self._step_size}, timeStepPerCycle: {dt}"
-        t_loop = t
-        for _ in range(0, int(dt / self._step_size)):
-            self._call_fmu_step(t_loop, self._step_size)
-            t_loop = t_loop + self._step_size
+        Args:
+            dt (float): Step size for a step including the steps per cycle.
 
-        self._log.debug("Reading Simulation Output.")
-        self._read_output_values()
+        Raises:
+            ValueError: Is raised if dt is not a multiple of the configured step size.
+
+        Returns:
+            int: Number of FMU steps per call of do_step.
+        """
+        # the check uses a relative tolerance, a float modulo or int() truncation rejects valid combinations such as 0.3 and 0.1
+        n_steps = round(dt / self._step_size)
+        if n_steps < 1 or abs(dt - n_steps * self._step_size) > 1e-12 * max(
+            dt, self._step_size
+        ):
+            raise ValueError(
+                f"timeStepPerCycle must be a multiple of StepSize. StepSize: {self._step_size}, timeStepPerCycle: {dt}"
+            )
+        return n_steps
+
+    def _specialize_steps(self, n_steps: int):
+        """Builds the function which advances the FMU by n_steps FMU steps from a given communication point.
+
+        Args:
+            n_steps (int): Number of FMU steps per call of do_step.
+
+        Returns:
+            Callable: A function taking the communication point t of the master.
+        """
+        call_fmu_step = self._call_fmu_step
+        step_size = self._step_size
+        if n_steps == 1:
+            # common case of one FMU step per cycle
+            return lambda t: call_fmu_step(t, step_size)
+        # the offsets of the communication points are computed once instead of accumulated, which also avoids floating point drift
+        offsets = tuple(i * step_size for i in range(n_steps))
+
+        def run_steps(t):
+            for offset in offsets:
+                call_fmu_step(t + offset, step_size)
+
+        return run_steps
 
     def get_total_time_per_cycle(self, dt):
         """Returns the total simulation time advanced per call of the do_step() method.
 
         The total time depends on the configured step size and the provided dt parameter.
-        It calculates the number of full steps that can be taken within dt and multiplies
-        it by the step size.
+        It calculates the number of steps taken within dt and multiplies it by the step size.
 
         Args:
             dt (float): The desired time step for the do_step() method.
 
+        Raises:
+            ValueError: Is raised if dt is not a multiple of the configured step size.
+
         Returns:
             float: Total simulation time in seconds advanced per do_step() call.
         """
-        return self._step_size * int(dt / self._step_size)
+        return self._step_size * self._steps_per_cycle(dt)
+
+
+# FMPy setter method and caster per FMI variable type
+_FMPY_SETTERS = {
+    "Real": ("setReal", float),
+    "Float32": ("setFloat32", float),
+    "Float64": ("setFloat64", float),
+    "Integer": ("setInteger", int),
+    "Int32": ("setInt32", int),
+    "Int64": ("setInt64", int),
+    "Boolean": ("setBoolean", bool),
+    "String": ("setString", str),
+}
+
+# FMPy getter method per FMI variable type
+_FMPY_GETTERS = {
+    "Real": "getReal",
+    "Float32": "getFloat32",
+    "Float64": "getFloat64",
+    "Integer": "getInteger",
+    "Int32": "getInt32",
+    "Int64": "getInt64",
+    "Boolean": "getBoolean",
+    "String": "getString",
+}
+
+# status codes above warning (error, fatal, ...) are failures for FMI 2 and FMI 3
+_FMI_WARNING = 1
+
+
+def _checked_fmi_call(function, *args):
+    """Binds the arguments to a raw FMI function. The returned function raises if the FMU reports an error."""
+
+    def call():
+        status = function(*args)
+        if status > _FMI_WARNING:
+            raise RuntimeError(f"{function.__name__} failed with status {status}.")
+
+    return call
+
+
+@functools.lru_cache(maxsize=None)
+def _read_fmu(path: str, mtime_ns: int):
+    """Reads the model description and collects the value references. The result is cached per path and modification time, so an
+    FMU which is rebuilt in place is read again.
+
+    Args:
+        path (str): Path to the FMU file.
+        mtime_ns (int): Modification time of the FMU file, only used as part of the cache key.
+
+    Returns:
+        tuple: The model description and a dict with the value reference, variability, causality and type of every model variable.
+        The dict is shared and must not be modified.
+    """
+    from fmpy import read_model_description
+
+    model_description = read_model_description(path)
+    vrs = {}
+    for variable in model_description.modelVariables:
+        vrs[variable.name] = {"valueReference": variable.valueReference, "variability": variable.variability, "causality": variable.causality, "type": variable.type}
+    return model_description, vrs
+
+
+# directories of all FMUs extracted by this process, they are removed when the process exits
+_extracted_dirs = []
+
+
+def _extract(path: str) -> str:
+    """Extracts the FMU into a new temporary directory which is removed at exit."""
+    from fmpy import extract
+
+    unzipdir = extract(path)
+    if not _extracted_dirs:
+        atexit.register(_remove_extracted_dirs)
+    _extracted_dirs.append(unzipdir)
+    return unzipdir
+
+
+def _remove_extracted_dirs():
+    """Removes the directories of all FMUs extracted by this process."""
+    while _extracted_dirs:
+        shutil.rmtree(_extracted_dirs.pop(), ignore_errors=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _extract_shared(path: str, mtime_ns: int) -> str:
+    """Extracts the FMU once per path and modification time into a directory that is shared by all instances of the FMU."""
+    return _extract(path)
+
+
+def _prepare_fmu(path: str):
+    """Reads the model description, collects the value references and extracts the FMU. Components using the same FMU share the
+    model description and, if the FMU can be instantiated multiple times per process, the extracted FMU. FMUs which can only be
+    instantiated once per process are extracted separately for every component so that their instances stay isolated.
+
+    Args:
+        path (str): Path to the FMU file.
+
+    Returns:
+        tuple: The model description, the directory of the extracted FMU and a dict with the value reference, variability, causality and
+        type of every model variable. The dict is shared and must not be modified.
+    """
+    mtime_ns = os.stat(path).st_mtime_ns
+    model_description, vrs = _read_fmu(path, mtime_ns)
+    if model_description.coSimulation.canBeInstantiatedOnlyOncePerProcess:
+        unzipdir = _extract(path)
+    else:
+        unzipdir = _extract_shared(path, mtime_ns)
+    return model_description, unzipdir, vrs
+
+
+def _instantiate_slave(model_description, unzipdir: str, instance_name: str):
+    """Creates the FMPy slave matching the FMI version of the model description."""
+    from fmpy.fmi2 import FMU2Slave
+    from fmpy.fmi3 import FMU3Slave
+
+    if model_description.fmiVersion == "3.0":
+        slave_class = FMU3Slave
+    else:
+        slave_class = FMU2Slave
+    return slave_class(
+        guid=model_description.guid,
+        unzipDirectory=unzipdir,
+        modelIdentifier=model_description.coSimulation.modelIdentifier,
+        instanceName=instance_name,
+    )
+
+
+class _FMI2Interface:
+    """FMI 2 specific calls of FMPySimClient. The FMI version is resolved once on load, so the step path does not branch on it."""
+
+    version = "2.0"
+    # numpy dtype and ctypes type of the numeric FMI types which are transferred through preallocated buffers
+    buffer_types = {
+        "Real": (np.float64, c_double),
+        "Integer": (np.int32, c_int),
+    }
+
+    def __init__(self, model):
+        self._model = model
+
+    def setup_experiment(self, start_time: float):
+        self._model.setupExperiment(startTime=start_time)
+
+    def bind_step_loop(self, step_size: float, n_steps: int):
+        """Binds a loop of n_steps calls of fmi2DoStep starting at a communication point t. The loop calls the library function
+        directly, so the FMU steps of one cycle do not pass through any Python method calls. The FMU library is loaded as ctypes.CDLL,
+        which releases the GIL for the duration of the call, so thread safe FMUs step concurrently."""
+        dll_do_step = self._model.dll.fmi2DoStep
+        dll_do_step.argtypes = [c_void_p, c_double, c_double, c_int]
+        dll_do_step.restype = c_int
+        component = self._model.component
+        offsets = tuple(i * step_size for i in range(n_steps))
+
+        def run_steps(t):
+            for offset in offsets:
+                status = dll_do_step(component, t + offset, step_size, 1)
+                if status > _FMI_WARNING:
+                    raise RuntimeError(f"fmi2DoStep failed with status {status}.")
+
+        return run_steps
+
+    def bind_transfer(self, function_name: str, c_type, vr_ptr, n: int, value_ptr):
+        """Binds the raw FMI function with the given name without the fmi2 prefix, e.g. "SetReal", to the value references and the buffer."""
+        function = getattr(self._model.dll, "fmi2" + function_name)
+        function.argtypes = [c_void_p, POINTER(c_uint32), c_size_t, POINTER(c_type)]
+        function.restype = c_int
+        return _checked_fmi_call(function, self._model.component, vr_ptr, n, value_ptr)
+
+
+class _FMI3Interface:
+    """FMI 3 specific calls of FMPySimClient."""
+
+    version = "3.0"
+    buffer_types = {
+        "Float64": (np.float64, c_double),
+        "Float32": (np.float32, c_float),
+        "Int32": (np.int32, c_int32),
+        "Int64": (np.int64, c_int64),
+    }
+
+    def __init__(self, model):
+        self._model = model
+
+    def setup_experiment(self, start_time: float):
+        # FMI 3 passes the start time on entering the initialization mode
+        pass
+
+    def bind_step_loop(self, step_size: float, n_steps: int):
+        """Binds a loop of n_steps calls of doStep starting at a communication point t. fmi3DoStep returns its event flags through
+        pointers, FMPy's wrapper takes care of them."""
+        do_step = self._model.doStep
+        offsets = tuple(i * step_size for i in range(n_steps))
+
+        def run_steps(t):
+            for offset in offsets:
+                do_step(t + offset, step_size)
+
+        return run_steps
+
+    def bind_transfer(self, function_name: str, c_type, vr_ptr, n: int, value_ptr):
+        """Binds the raw FMI function with the given name without the fmi3 prefix, e.g. "SetFloat64", to the value references and the buffer."""
+        function = getattr(self._model.dll, "fmi3" + function_name)
+        function.argtypes = [
+            c_void_p,
+            POINTER(c_uint32),
+            c_size_t,
+            POINTER(c_type),
+            c_size_t,
+        ]
+        function.restype = c_int
+        return _checked_fmi_call(function, self._model.component, vr_ptr, n, value_ptr, n)
+
+
+_FMI_INTERFACES = {
+    _FMI2Interface.version: _FMI2Interface,
+    _FMI3Interface.version: _FMI3Interface,
+}
 
 
 class FMPySimClient(FMUSimClient):
@@ -114,56 +413,178 @@ class FMPySimClient(FMUSimClient):
 
     def _load_model(self, path):
         self._log.info("Using FMPy as FMU Backend")
-        # read model description
-        model_description = read_model_description(path)
-        if model_description.fmiVersion == "2.0":
-            self._fmi_version = "2.0"
-        elif model_description.fmiVersion == "3.0":
-            self._fmi_version = "3.0"
-        else:
+        # the backends are imported on load, so only the configured one has to be installed
+        from fmpy.fmi2 import FMU2Slave
+        from fmpy.fmi3 import FMU3Slave
+
+        self._slave_classes = (FMU2Slave, FMU3Slave)
+        # specialized setter and getter functions of _set_fmu_value and _get_fmu_value, bound on first use of a variable
+        self._setter_by_key = {}
+        self._getter_by_key = {}
+        model_description, unzipdir, self._vrs = _prepare_fmu(path)
+        if model_description.fmiVersion not in _FMI_INTERFACES:
             raise ValueError(f"Unsupported FMI version: {model_description.fmiVersion}")
-        # collect the value references
-        self._vrs = {}
-        for variable in model_description.modelVariables:
-            self._vrs[variable.name] = {"valueReference": variable.valueReference, "variability": variable.variability, "causality": variable.causality, "type": variable.type}
-        # extract the FMU
-        unzipdir = extract(path)
-
-        if self._fmi_version == "2.0":
-            return FMU2Slave(
-                guid=model_description.guid,
-                unzipDirectory=unzipdir,
-                modelIdentifier=model_description.coSimulation.modelIdentifier,
-                instanceName="instance1",
-            )
-        elif self._fmi_version == "3.0":
-            return FMU3Slave(
-                guid=model_description.guid,
-                unzipDirectory=unzipdir,
-                modelIdentifier=model_description.coSimulation.modelIdentifier,
-                instanceName="instance1",
-            )
+        self._fmi_version = model_description.fmiVersion
+        # FMUs which may be instantiated multiple times per process can be stepped concurrently to other components
+        self._thread_safe = (
+            not model_description.coSimulation.canBeInstantiatedOnlyOncePerProcess
+        )
+        model = _instantiate_slave(model_description, unzipdir, "instance1")
+        # all version specific calls go through this object
+        self._fmi = _FMI_INTERFACES[self._fmi_version](model)
+        return model
 
     def _init_model(self):
+        # the model class does not change after loading, so it is checked once here instead of on every variable access
+        if not isinstance(self._model, self._slave_classes):
+            raise ValueError("The FMU is not version 2.0 or 3.0")
         self._time = 0
         # initialize
         self._model.instantiate()
-        if self._fmi_version == "2.0":
-            self._model.setupExperiment(startTime=self._time)
+        self._fmi.setup_experiment(self._time)
         self._model.enterInitializationMode()
         self._model.exitInitializationMode()
 
+        # numeric variables are kept as struct of arrays: one value reference array and one value buffer per FMI type. The FMI
+        # functions of the shared library work directly on these buffers with one call per type and step.
+        input_other_refs, self._input_buffers = self._build_buffers(
+            "Set", self._input_refs, settable=True
+        )
+        output_other_refs, self._output_buffers = self._build_buffers(
+            "Get", self._output_refs
+        )
+        # the remaining variables are resolved to their value reference and bound FMU method once, invalid variables raise here.
+        # Variables of the same type are grouped so that each type is transferred with a single FMI call per step.
+        input_batches = {}
+        for key, node_id in input_other_refs:
+            vr, setter, cast = self._bind_fmu_setter(node_id)
+            keys, vrs, _, _ = input_batches.setdefault(
+                self._vrs[node_id]["type"], ([], [], setter, cast)
+            )
+            keys.append(key)
+            vrs.append(vr)
+        self._input_batches = list(input_batches.values())
+        output_batches = {}
+        for key, node_id in output_other_refs:
+            vr, getter = self._bind_fmu_getter(node_id)
+            keys, vrs, _ = output_batches.setdefault(
+                self._vrs[node_id]["type"], ([], [], getter)
+            )
+            keys.append(key)
+            vrs.append(vr)
+        self._output_batches = list(output_batches.values())
+
+    def _build_buffers(self, kind: str, refs, settable=False):
+        """Buckets the numeric variables of the given (name, node id) pairs by FMI type and binds one buffered FMI call per type.
+
+        Args:
+            kind (str): Either "Set" or "Get".
+            refs (list[tuple[str, str]]): Pairs of variable name and node id.
+            settable (bool, optional): Only buffer variables which can be set. Defaults to False.
+
+        Returns:
+            tuple[list, list]: The pairs of all variables which are not buffered and a list of (names, value references, value buffer,
+            transfer function) tuples, one per type.
+        """
+        buffer_types = self._fmi.buffer_types
+        buckets = {}
+        others = []
+        for key, node_id in refs:
+            variable = self._vrs.get(node_id)
+            if (
+                variable is None
+                or variable["type"] not in buffer_types
+                or (
+                    settable
+                    and variable["causality"] != "input"
+                    and variable["variability"] != "tunable"
+                )
+            ):
+                # booleans, strings and unknown or read-only variables take the checked path, which raises for invalid variables
+                others.append((key, node_id))
+                continue
+            keys, vrs = buckets.setdefault(variable["type"], ([], []))
+            keys.append(key)
+            vrs.append(variable["valueReference"])
+
+        buffers = []
+        for type_name, (keys, vrs) in buckets.items():
+            dtype, c_type = buffer_types[type_name]
+            vr_array = np.array(vrs, dtype=np.uint32)
+            buffer = np.zeros(len(vrs), dtype=dtype)
+            transfer = self._bind_buffer_access(kind + type_name, c_type, vr_array, buffer)
+            buffers.append((keys, vr_array, buffer, transfer))
+        return others, buffers
+
+    def _bind_buffer_access(self, function_name: str, c_type, vrs: np.ndarray, buffer: np.ndarray):
+        """Binds the FMI function which sets or gets the values of the given value references from or into the buffer.
+
+        Args:
+            function_name (str): Name of the FMI function without the fmi2/fmi3 prefix, e.g. "SetReal".
+            c_type: ctypes type of a single value.
+            vrs (np.ndarray): Value references as uint32 array.
+            buffer (np.ndarray): Value buffer with the same length as vrs and a dtype matching c_type.
+
+        Returns:
+            Callable: A function without arguments which transfers all values in one FMI call.
+        """
+        n = len(vrs)
+        vr_ptr = vrs.ctypes.data_as(POINTER(c_uint32))
+        value_ptr = buffer.ctypes.data_as(POINTER(c_type))
+        # the raw functions of the shared library are called, bypassing FMPy's per call wrapper
+        return self._fmi.bind_transfer(function_name, c_type, vr_ptr, n, value_ptr)
+
     def _set_input_values(self):
-        for key, val in self.get_input_values().items():
-            val = self._set_fmu_value(self.get_node_by_name(key), val)
+        input_values = self._input_values
+        for keys, _, buffer, transfer in self._input_buffers:
+            buffer[:] = [input_values[key] for key in keys]
+            transfer()
+        for keys, vrs, setter, cast in self._input_batches:
+            setter(vrs, [cast(input_values[key]) for key in keys])
+
     def _read_output_values(self):
-        for key in self.get_output_values().keys():
-            val = self._get_fmu_value(self.get_node_by_name(key))
-            self.set_output_value(key, val)
+        output_values = self._output_values
+        for keys, _, buffer, transfer in self._output_buffers:
+            transfer()
+            output_values.update(zip(keys, buffer.tolist()))
+        for keys, vrs, getter in self._output_batches:
+            output_values.update(zip(keys, getter(vrs)))
+
+    def do_step_blocking(self, t: float, dt: float):
+        # the generic path validates a new dt, specializes the step and logs in debug mode
+        if dt != self._last_dt or self._log.isEnabledFor(logging.DEBUG):
+            super().do_step_blocking(t, dt)
+            return
+        self._step(t)
+
+    def _specialize_steps(self, n_steps: int):
+        # the loop over the FMU steps of one cycle is bound to the library function itself
+        run_steps = self._fmi.bind_step_loop(self._step_size, n_steps)
+        self._step = self._compose_step(run_steps)
+        return run_steps
+
+    def _compose_step(self, run_steps):
+        """Builds a single function for a whole cycle: transferring the inputs, running the FMU steps and reading the outputs with the
+        transfers bound in _init_model. Source or sink only FMUs skip the corresponding transfer.
+
+        Args:
+            run_steps (Callable): The step loop for the current dt.
+
+        Returns:
+            Callable: A function taking the communication point t of the master.
+        """
+        set_input_values = self._set_input_values if self._has_inputs else None
+        read_output_values = self._read_output_values if self._has_outputs else None
+
+        def step(t):
+            if set_input_values is not None:
+                set_input_values()
+            run_steps(t)
+            if read_output_values is not None:
+                read_output_values()
+
+        return step
 
-    def _call_fmu_step(self, t, dt):
-        self._model.doStep(currentCommunicationPoint=t, communicationStepSize=dt)
-        
     def _set_fmu_value(self, key: str, value: float | int | bool | str):
         """
         Set a value in the FMU. Only input variables and tunable parameters can be set. Floats, ints, booleans and strings can be set. 
@@ -175,75 +596,82 @@ class FMPySimClient(FMUSimClient):
         Raises:
             KeyError: If the variable is not found in the variables dictionary.
             ValueError: If the parameter is not an input or a tunable parameter.
-            ValueError: If the FMU is not version 2.0 or 3.0.
             ValueError: If the type of the parameter is unknown.
             
         """
+        set_value = self._setter_by_key.get(key)
+        if set_value is None:
+            vr, setter, cast = self._bind_fmu_setter(key)
+            set_value = self._setter_by_key[key] = (
+                lambda value, _vrs=[vr]: setter(_vrs, [cast(value)])
+            )
+        set_value(value)
+
+    def _get_fmu_value(self, key: str) -> float | int | bool | str:
+        """
+        Get a value from the FMU. All variable types can be retrieved.
+
+        Args:
+            key (str): The key of the value to get.
+
+        Returns:
+            float | int | bool | str: The value retrieved from the FMU.
+
+        Raises:
+            KeyError: If the variable is not found in the variables dictionary.
+            ValueError: If the type of the parameter is unknown.
+        """
+        get_value = self._getter_by_key.get(key)
+        if get_value is None:
+            vr, getter = self._bind_fmu_getter(key)
+            get_value = self._getter_by_key[key] = lambda _vrs=[vr]: getter(_vrs)[0]
+        return get_value()
+
+    def _bind_fmu_setter(self, key: str):
+        """
+        Resolve the value reference, the setter of the FMU and the caster for a variable. Only input variables and tunable parameters can be set.
+
+        Args:
+            key (str): The key of the value to set.
+
+        Returns:
+            tuple[int, Callable, Callable]: The value reference, the bound setter method and the caster for the value.
+
+        Raises:
+            KeyError: If the variable is not found in the variables dictionary.
+            ValueError: If the parameter is not an input or a tunable parameter.
+            ValueError: If the type of the parameter is unknown.
+        """
         if key not in self._vrs:
             raise KeyError(f"Variable {key} can not be set in FMU because it is not found in the variables dictionary")
         if self._vrs[key]["causality"] != "input" and self._vrs[key]["variability"] != "tunable":
             raise ValueError(f"Parameter {key} is not an input or tunable parameter, causality: {self._vrs[key]['causality']}, variability: {self._vrs[key]['variability']}")
-        if not isinstance(self._model, (FMU2Slave, FMU3Slave)):
-            raise ValueError(f"The FMU is not version 2.0 or 3.0")
-        match self._vrs[key]["type"]:
-            case "Real":
-                    self._model.setReal([self._vrs[key]["valueReference"]], [float(value)])
-            case "Float32":    
-                    self._model.setFloat32([self._vrs[key]["valueReference"]], [float(value)])
-            case "Float64":    
-                    self._model.setFloat64([self._vrs[key]["valueReference"]], [float(value)])
-            case "Integer":
-                    self._model.setInteger([self._vrs[key]["valueReference"]], [int(value)])
-            case "Int32":
-                    self._model.setInt32([self._vrs[key]["valueReference"]], [int(value)])
-            case "Int64":
-                    self._model.setInt64([self._vrs[key]["valueReference"]], [int(value)])
-            case "Boolean":
-                self._model.setBoolean([self._vrs[key]["valueReference"]], [bool(value)])
-            case "String":
-                self._model.setString([self._vrs[key]["valueReference"]], [str(value)])
-            case _:
-                raise ValueError(f"Unknown type: {self._vrs[key]['type']}")
+        if self._vrs[key]["type"] not in _FMPY_SETTERS:
+            raise ValueError(f"Unknown type: {self._vrs[key]['type']}")
+        method_name, cast = _FMPY_SETTERS[self._vrs[key]["type"]]
+        return self._vrs[key]["valueReference"], getattr(self._model, method_name), cast
 
-    def _get_fmu_value(self, key: str) -> float | int | bool | str:
+    def _bind_fmu_getter(self, key: str):
         """
-        Get a value from the FMU. All variable types can be retrieved.
+        Resolve the value reference and the getter of the FMU for a variable. All variable types can be retrieved.
 
         Args:
             key (str): The key of the value to get.
 
         Returns:
-            float | int | bool | str: The value retrieved from the FMU.
+            tuple[int, Callable]: The value reference and the bound getter method.
 
         Raises:
             KeyError: If the variable is not found in the variables dictionary.
-            ValueError: If the FMU is not version 2.0 or 3.0.
             ValueError: If the type of the parameter is unknown.
         """
         if key not in self._vrs:
             raise KeyError(f"Variable {key} can not be retrieved from FMU because it is not found in the variables dictionary")
-        if not isinstance(self._model, (FMU2Slave, FMU3Slave)):
-            raise ValueError(f"The FMU is not version 2.0 or 3.0")
-        
-        match self._vrs[key]["type"]:
-            case "Real":
-                    return self._model.getReal([self._vrs[key]["valueReference"]])[0]
-            case "Float32":
-                return self._model.getFloat32([self._vrs[key]["valueReference"]])[0]
-            case "Float64":
-                return self._model.getFloat64([self._vrs[key]["valueReference"]])[0]
-            case "Integer":
-                    return self._model.getInteger([self._vrs[key]["valueReference"]])[0]
-            case "Int32":
-                    return self._model.getInt32([self._vrs[key]["valueReference"]])[0]
-            case "Int64":
-                    return self._model.getInt64([self._vrs[key]["valueReference"]])[0]
-            case "Boolean":
-                return self._model.getBoolean([self._vrs[key]["valueReference"]])[0]
-            case "String":
-                return self._model.getString([self._vrs[key]["valueReference"]])[0]
-            case _:
-                raise ValueError(f"Unknown type: {self._vrs[key]['type']}")
+        if self._vrs[key]["type"] not in _FMPY_GETTERS:
+            raise ValueError(f"Unknown type: {self._vrs[key]['type']}")
+        return self._vrs[key]["valueReference"], getattr(
+            self._model, _FMPY_GETTERS[self._vrs[key]["type"]]
+        )
 
 class PyFMISimClient(FMUSimClient):
 
@@ -251,6 +679,9 @@ class PyFMISimClient(FMUSimClient):
 
     def _load_model(self, path):
         self._log.info("Using PyFMI as FMU Backend")
+        import pyfmi.fmi as fmi
+        from pyfmi import load_fmu
+
         model = load_fmu(path)
 
         if type(model) != fmi.FMUModelCS2:
@@ -265,14 +696,61 @@ class PyFMISimClient(FMUSimClient):
         self._model.set_additional_logger(self.fmu_log_callback_wrapper)
         self._model.initialize()
 
+        # variables are resolved to value references once and grouped by type, so each type is transferred with a single call of
+        # PyFMI's typed set/get functions per step instead of resolving the names in every call of set/get
+        import pyfmi.fmi as fmi
+
+        accessors = {
+            fmi.FMI2_REAL: ("set_real", "get_real", np.ndarray.tolist),
+            fmi.FMI2_INTEGER: ("set_integer", "get_integer", np.ndarray.tolist),
+            fmi.FMI2_BOOLEAN: ("set_boolean", "get_boolean", np.ndarray.tolist),
+            fmi.FMI2_STRING: ("set_string", "get_string", list),
+            fmi.FMI2_ENUM: ("set_integer", "get_integer", np.ndarray.tolist),
+        }
+        self._input_batches = [
+            (keys, vrs, getattr(self._model, accessors[data_type][0]))
+            for data_type, (keys, vrs) in self._group_by_type(self._input_refs).items()
+        ]
+        self._output_batches = [
+            (
+                keys,
+                vrs,
+                getattr(self._model, accessors[data_type][1]),
+                accessors[data_type][2],
+            )
+            for data_type, (keys, vrs) in self._group_by_type(self._output_refs).items()
+        ]
+
+    def _group_by_type(self, refs):
+        """Groups (name, node id) pairs by the data type of the FMU variable.
+
+        Args:
+            refs (list[tuple[str, str]]): Pairs of variable name and node id.
+
+        Returns:
+            dict: Maps each PyFMI data type to the variable names and their value references as uint32 array.
+        """
+        groups = {}
+        for key, node_id in refs:
+            keys, vrs = groups.setdefault(
+                self._model.get_variable_data_type(node_id), ([], [])
+            )
+            keys.append(key)
+            vrs.append(self._model.get_variable_valueref(node_id))
+        return {
+            data_type: (keys, np.array(vrs, dtype=np.uint32))
+            for data_type, (keys, vrs) in groups.items()
+        }
+
     def _set_input_values(self):
-        for key, val in self.get_input_values().items():
-            self._model.set(self.get_node_by_name(key), val)
+        input_values = self._input_values
+        for keys, vrs, setter in self._input_batches:
+            setter(vrs, [input_values[key] for key in keys])
 
     def _read_output_values(self):
-        for key in self.get_output_values().keys():
-            val = self._model.get(self.get_node_by_name(key))
-            self.set_output_value(key, val[0])
+        output_values = self._output_values
+        for keys, vrs, getter, to_list in self._output_batches:
+            output_values.update(zip(keys, to_list(getter(vrs))))
 
     def _call_fmu_step(self, t, dt):
         self._model.do_step(t, dt, True)
@@ -25,6 +25,7 @@ class MasterComponent(SimulationComponent):
             unit="%",
             bar_format="{l_bar}{bar}| {n:.2f}{unit}/{total:.2f}{unit} [{elapsed}<{remaining}]",
             dynamic_ncols=True,
+            mininterval=0.5,
             colour=color,
             desc=desc,
         )
@@ -40,11 +41,19 @@ class MasterComponent(SimulationComponent):
             self._pbar.close()
             return
 
-        progress = min(max(0, min([self.get_progress(), self._mapper.get_progress()])), 1)
-        if (progress - self._prev_progress) * 100 >= 1:
-            self._pbar.update(round((progress - self._prev_progress) * 100, 4))
+        progress = self.get_progress()
+        mapper_progress = self._mapper.get_progress()
+        if mapper_progress < progress:
+            progress = mapper_progress
+        if progress < 0:
+            progress = 0
+        elif progress > 1:
+            progress = 1
+        # tqdm renders rate limited by mininterval, so the bar is not refreshed explicitly
+        delta = (progress - self._prev_progress) * 100
+        if delta >= 1:
+            self._pbar.update(delta)
             self._prev_progress = progress
-            self._pbar.refresh()
 
     @abstractmethod
     async def run(self):
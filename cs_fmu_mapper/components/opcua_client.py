@@ -1,6 +1,9 @@
 import asyncio
+from collections import deque
 from abc import ABC, abstractmethod
 import asyncua.common
+from asyncua import ua
+from asyncua.client.ua_client import UASocketState
 
 # from simulation_component import SimulationComponent
 
@@ -17,25 +20,37 @@ class AbstractOPCUAClient(ABC):
         self._host = config["host"]
         self._port = config["port"]
         self._connection: asyncua.Client = None
+        # connection state maintained by _connect and _disconnect, is_connected does not inspect the protocol
+        self._connected = False
         self._nodes = {}
         self._running = False
         self._lock = lock
+        # with a subscription the server pushes changed output values instead of the outputs being read every cycle
+        self._subscribe_outputs = (
+            config["subscribeOutputs"] if "subscribeOutputs" in config else False
+        )
+        self._subscription_period = (
+            config["subscriptionPeriod"] if "subscriptionPeriod" in config else 100
+        )
+        self._subscription = None
 
     async def _connect(self):
         """Connects client to OPCUA Server if it isn't already connected."""
-        if not self.is_connected():
+        if not self._protocol_is_open():
             self._log.info("Connecting to Client to OPCUA server...")
             self._connection = asyncua.Client(
                 url="opc.tcp://" + self._host + ":" + self._port + "/"
             )
             await self._connection.connect()
+            self._connected = True
             self._log.info("Client connected.")
         else:
             self._log.info("Client already connected.")
 
     async def _disconnect(self):
         """Disconnects client from OPCUA Server if it is connected."""
-        if self.is_connected():
+        if self._protocol_is_open():
+            self._connected = False
             await self._connection.disconnect()
             self._log.info("Client disconnected.")
         else:
@@ -63,6 +78,103 @@ class AbstractOPCUAClient(ABC):
             self._nodes[out_var] = output_node
             self._output_values[out_var] = self._config["outputVar"][out_var]["init"]
 
+        # ordered node lists for the batched reads and writes
+        self._input_keys = tuple(self._config["inputVar"].keys())
+        self._input_nodes = [self._nodes[key] for key in self._input_keys]
+        # the written variants follow the DataType attribute of the nodes, independent of the values written first
+        self._input_variant_types = await asyncio.gather(
+            *(node.read_data_type_as_variant_type() for node in self._input_nodes)
+        )
+        self._output_keys = tuple(self._config["outputVar"].keys())
+        self._output_nodes = [self._nodes[key] for key in self._output_keys]
+        if self._subscribe_outputs and self._output_nodes:
+            await self._subscribe()
+
+    async def _subscribe(self):
+        """Subscribes to data changes of all output nodes. The initial values are sent by the server right after subscribing."""
+        self._output_key_by_node = {
+            node.nodeid: key for key, node in zip(self._output_keys, self._output_nodes)
+        }
+        self._subscription = await self._connection.create_subscription(
+            self._subscription_period, self
+        )
+        await self._subscription.subscribe_data_change(self._output_nodes)
+        self._log.info(
+            f"Subscribed to {len(self._output_nodes)} output nodes with a publishing interval of {self._subscription_period} ms."
+        )
+
+    async def _unsubscribe(self):
+        """Deletes the output subscription if there is one."""
+        if self._subscription is not None:
+            await self._subscription.delete()
+            self._subscription = None
+
+    def datachange_notification(self, node, val, data):
+        """Called by asyncua for every data change of a subscribed output node."""
+        self._output_values[self._output_key_by_node[node.nodeid]] = val
+
+    async def read_all_outputs(self):
+        """Reads the values of all output nodes with a single OPC UA read request and stores them in the output values. With a subscription
+        the output values are already up to date."""
+        if not self._output_nodes or self._subscription is not None:
+            return
+        try:
+            values = await self._connection.read_values(self._output_nodes)
+        except Exception:
+            # a failed request usually means the connection is gone, the cached flag must not claim otherwise
+            self._connected = False
+            raise
+        self._output_values.update(zip(self._output_keys, values))
+
+    async def _pipelined_read_values(self, nodes, depth=1):
+        """Reads the values of the nodes repeatedly and yields them in request order. Up to depth read requests are in flight at the
+        same time, so the round trip of the next read overlaps with the processing of the current values. The yielded values are
+        then up to depth - 1 reads old.
+
+        Args:
+            nodes (list[asyncua.Node]): The nodes to read with one request.
+            depth (int, optional): Maximum number of outstanding read requests. Defaults to 1.
+
+        Yields:
+            list: The values of the nodes.
+        """
+        pending = deque()
+        try:
+            while True:
+                while len(pending) < depth:
+                    pending.append(
+                        asyncio.ensure_future(self._connection.read_values(nodes))
+                    )
+                try:
+                    values = await pending.popleft()
+                except Exception:
+                    self._connected = False
+                    raise
+                yield values
+        finally:
+            for request in pending:
+                request.cancel()
+
+    async def write_all_inputs(self):
+        """Writes the input values to all input nodes with a single OPC UA write request. The data types of the nodes are resolved by
+        init_nodes."""
+        if not self._input_nodes:
+            return
+        input_values = self._input_values
+        try:
+            await self._connection.write_values(
+                self._input_nodes,
+                [
+                    ua.DataValue(ua.Variant(input_values[key], variant_type))
+                    for key, variant_type in zip(
+                        self._input_keys, self._input_variant_types
+                    )
+                ],
+            )
+        except Exception:
+            self._connected = False
+            raise
+
     async def run(self) -> None:
         """Connects client, invokes node initialization and delegates normal client operation to client specific _run() method. Disconnects and finalizes on asyncio.CancelledError."""
         await self._connect()
@@ -77,6 +189,7 @@ class AbstractOPCUAClient(ABC):
         except (asyncio.CancelledError, KeyboardInterrupt):
             self._log.info("Canceling OPCUA Client...")
             await self._finalize()
+        await self._unsubscribe()
         await self._disconnect()
         self._log.info("OPCUA Client has been cancelled.")
 
@@ -90,15 +203,25 @@ class AbstractOPCUAClient(ABC):
         Returns:
             bool: return true if client is connected, false if client is not connected
         """
-        if self._connection == None:
-            return False
-        elif self._connection.uaclient.protocol == None:
-            return False
-        elif self._connection.uaclient.protocol.state == "open":
-            return True
+        return self._connected
+
+    def _protocol_is_open(self):
+        """Checks the state of the underlying OPC UA protocol, which also detects connections closed by the server. Only used when
+        connecting and disconnecting.
+
+        Returns:
+            bool: return true if the protocol is open
+        """
+        if self._connection is None or self._connection.uaclient.protocol is None:
+            is_open = False
         else:
-            print(self._connection.uaclient.protocol.state)
-            return False
+            state = self._connection.uaclient.protocol.state
+            is_open = state == UASocketState.OPEN
+            if not is_open:
+                self._log.debug(f"OPCUA protocol state is {state}.")
+        if not is_open:
+            self._connected = False
+        return is_open
 
     @abstractmethod
     async def _run(self):
@@ -1,8 +1,12 @@
+import asyncio
+import logging
 import os
 from abc import ABC, abstractmethod
-from copy import copy
+from concurrent.futures import ProcessPoolExecutor
+from collections import ChainMap
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from cs_fmu_mapper.components.simulation_component import SimulationComponent
 from matplotlib.axes import Axes
@@ -16,7 +20,6 @@ class Plotter(SimulationComponent):
 
     def __init__(self, config, name):
         super(Plotter, self).__init__(config, name)
-        self._t = []
         self._data = {}
         self._output_path = config["outputFolder"]
         self._plots_path = self._output_path + "/plots"
@@ -25,69 +28,211 @@ class Plotter(SimulationComponent):
             if "exclude_n_values" not in self._config
             else self._config["exclude_n_values"]
         )
-        for key in self._config["inputVar"].keys():
-            self._data[self._config["inputVar"][key]["nodeID"]] = []
+        # e.g. "%.6g", formatting floats with full precision is the most expensive part of writing the CSV
+        self._csv_float_format = (
+            None
+            if "csvFloatFormat" not in self._config
+            else self._config["csvFloatFormat"]
+        )
+        # the plot settings are bound once instead of being looked up in the config
+        self._plots_config = self._config["plots"] if "plots" in self._config else None
+        self._merge_plot = (
+            self._config["mergePlot"] if "mergePlot" in self._config else False
+        )
+        # generate the plots in a process pool, matplotlib rendering is CPU bound and the plots are independent
+        self._parallel_plots = (
+            self._config["parallelPlots"] if "parallelPlots" in self._config else False
+        )
+        self._rc_params = {}
+        if "usetex" in self._config:
+            self._rc_params["text.usetex"] = self._config["usetex"]
+        if "fontfamily" in self._config:
+            self._rc_params["font.family"] = self._config["fontfamily"]
+        self._csv_engine = (
+            "pandas" if "csvEngine" not in self._config else self._config["csvEngine"]
+        )
+        self._input_keys = tuple(self._config["inputVar"].keys())
+        self._node_ids = tuple(
+            self._config["inputVar"][key]["nodeID"] for key in self._input_keys
+        )
+        # the recorded values are stored in a preallocated record array with one field per variable, which grows by doubling if the
+        # number of steps exceeds the expected number. The fields are typed by the first recorded values, see _record_changed_types.
+        capacity = (
+            1024 if "expectedSteps" not in self._config else self._config["expectedSteps"]
+        )
+        # float32 halves the memory of recorded floats, integer and boolean variables and the time keep their exact types
+        self._dtype = np.dtype(
+            "float64" if "dtype" not in self._config else self._config["dtype"]
+        )
+        self._n_steps = 0
+        self._t = np.empty(max(1, capacity), dtype=np.float64)
+        self._values = None
+        self._kinds = None
+        self._row_types = None
+        # lists of the recorded values per variable, used instead of the record array once a variable is not numeric
+        self._columns = None
 
     def get_output_values(self):
         raise NotImplementedError()
 
     async def do_step(self, t, dt):
-        for key, val in self.get_input_values().items():  # type: ignore
-            nodeID = self.get_node_by_name(key)
-            self._data[nodeID].append(val)
-        self._t.append(t)
+        i = self._n_steps
+        if i == len(self._t):
+            self._grow_buffers()
+        row = tuple(map(self._input_values.__getitem__, self._input_keys))
+        if self._columns is not None:
+            for column, value in zip(self._columns, row):
+                column.append(value)
+        elif tuple(map(type, row)) == self._row_types:
+            self._values[i] = row
+        else:
+            self._record_changed_types(i, row)
+        self._t[i] = t
+        self._n_steps = i + 1
         return True
 
-    def save_data(self):
-        df = pd.DataFrame(self._data)
-        self._log.info("Saving data to: " + self._output_path + "/data.csv")
-        df.to_csv(self._output_path + "/data.csv", index=False)
+    def _record_changed_types(self, i, row):
+        """Records a row whose value types differ from the previous row. The fields of the record array are typed by the first row,
+        integer fields which receive floats are promoted to floats. Any other change of a type and values which are not numeric
+        switch the recording to lists of values, so every value is kept as it is.
+
+        Args:
+            i (int): Index of the step.
+            row (tuple): Values of the variables in the order of the input keys.
+        """
+        kinds = [_value_kind(value) for value in row]
+        if self._values is None:
+            if None in kinds:
+                self._record_as_lists(i, row)
+                return
+            self._kinds = kinds
+            self._values = np.empty(len(self._t), dtype=self._record_dtype())
+        else:
+            promoted = list(self._kinds)
+            for j, (field_kind, kind) in enumerate(zip(self._kinds, kinds)):
+                if kind == field_kind or (field_kind == "f" and kind == "i"):
+                    continue
+                if field_kind == "i" and kind == "f":
+                    promoted[j] = "f"
+                    continue
+                self._record_as_lists(i, row)
+                return
+            if promoted != self._kinds:
+                self._kinds = promoted
+                self._values = self._values.astype(self._record_dtype())
+        self._values[i] = row
+        self._row_types = tuple(map(type, row))
+
+    def _record_dtype(self):
+        """Returns the dtype of the record array for the current kinds of the variables."""
+        return np.dtype(
+            [
+                (f"v{j}", self._dtype if kind == "f" else _KIND_DTYPES[kind])
+                for j, kind in enumerate(self._kinds)
+            ]
+        )
 
-    async def finalize(self):
-        self._log.info("Generating Plots.")
-        self._data["time"] = self._t
+    def _record_as_lists(self, i, row):
+        """Moves the first i recorded steps from the record array to lists and appends the given row."""
+        if self._values is None:
+            self._columns = [[] for _ in self._input_keys]
+        else:
+            self._columns = [
+                self._values[name][:i].tolist() for name in self._values.dtype.names
+            ]
+        self._values = None
+        for column, value in zip(self._columns, row):
+            column.append(value)
+
+    def _grow_buffers(self):
+        """Doubles the capacity of the recording buffers."""
+        capacity = 2 * len(self._t)
+        t = np.empty(capacity, dtype=np.float64)
+        t[: self._n_steps] = self._t[: self._n_steps]
+        self._t = t
+        if self._values is not None:
+            values = np.empty(capacity, dtype=self._values.dtype)
+            values[: self._n_steps] = self._values[: self._n_steps]
+            self._values = values
 
-        if "usetex" in self._config.keys():
-            plt.rcParams.update(
-                {
-                    "text.usetex": self._config["usetex"],
-                }
+    def save_data(self):
+        data_path = os.path.join(self._output_path, "data.csv")
+        self._log.info("Saving data to: " + data_path)
+        if self._write_csv_pyarrow(data_path):
+            return
+        # the columns are numpy arrays already, so the DataFrame wraps them without copying
+        df = pd.DataFrame(self._data, copy=False)
+        df.to_csv(data_path, index=False, float_format=self._csv_float_format)
+
+    def _write_csv_pyarrow(self, path):
+        """Writes the data with PyArrow's CSV writer if the "pyarrow" engine is configured. PyArrow formats the columns in C++ instead
+        of pandas' Python CSV formatter. It has no float format, so a configured csvFloatFormat is written with pandas.
+
+        Returns:
+            bool: True if the data has been written.
+        """
+        if self._csv_engine != "pyarrow" or self._csv_float_format is not None:
+            return False
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+        except ImportError:
+            self._log.warning(
+                "PyArrow is not installed, falling back to pandas for writing the data."
             )
+            return False
+        pacsv.write_csv(pa.table(self._data), path)
+        return True
 
-        if "fontfamily" in self._config.keys():
-            plt.rcParams.update(
-                {
-                    "font.family": self._config["fontfamily"],
-                }
-            )
+    async def finalize(self):
+        self._log.info("Generating Plots.")
+        # the columns of the recorded steps are handed out as views, no data is copied
+        n = self._n_steps
+        for j, node_id in enumerate(self._node_ids):
+            if self._columns is not None:
+                self._data[node_id] = self._columns[j]
+            elif self._values is not None:
+                self._data[node_id] = self._values[f"v{j}"][:n]
+            else:
+                self._data[node_id] = []
+        self._data["time"] = self._t[:n]
+
+        if self._rc_params:
+            plt.rcParams.update(self._rc_params)
         # Remove the first n values from the data
         for column in self._data.keys():
             self._data[column] = self._data[column][self._exclude_n_values :]
         # Generate plots
-        if "plots" in self._config.keys():
+        if self._plots_config is not None:
             if not os.path.exists(self._plots_path):
                 os.makedirs(self._plots_path)
-            self.save_data()
+            # writing the CSV can take seconds for long runs, it is done in a worker thread so the event loop is not blocked
+            await asyncio.to_thread(self.save_data)
 
             # Create PDF for merged plots if specified
             merge_pdf = None
-            if "mergePlot" in self._config and self._config["mergePlot"]:
+            if self._merge_plot:
                 merge_pdf = PdfPages(
                     os.path.join(self._output_path, "merged_plots.pdf")
                 )
 
-            for plot_name, plot_config in self._config["plots"].items():
+            for plot_name, plot_config in self._plots_config.items():
                 plot_config["path"] = self._plots_path
                 plot_config["plot_name"] = plot_name
                 plot_config["merge_pdf"] = merge_pdf
-                if "type" in plot_config.keys():
+                if "type" not in plot_config.keys():
+                    raise ValueError(f"Plot type not specified for plot {plot_name}")
+
+            # the pages of the merged PDF can not be shared between processes, so merged plots are always generated here
+            if self._parallel_plots and merge_pdf is None and len(self._plots_config) > 1:
+                await self._generate_plots_in_processes()
+            else:
+                for plot_name, plot_config in self._plots_config.items():
                     plot = PlotFactory.instantiate_plot(
                         plot_config["type"], self._data, plot_config
                     )
                     plot.generate()
                     self._log.info(f"Plot '{plot_name}' generated.")
-                else:
-                    raise ValueError(f"Plot type not specified for plot {plot_name}")
 
             if merge_pdf is not None:
                 merge_pdf.close()
@@ -98,6 +243,78 @@ class Plotter(SimulationComponent):
         self._log.info(f"Plots generated. View them at {self._output_path}")
         return True
 
+    async def _generate_plots_in_processes(self):
+        """Generates the plots concurrently in a process pool. Each process only receives the columns used by its plot."""
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(
+            max_workers=min(len(self._plots_config), os.cpu_count() or 1)
+        ) as executor:
+            futures = {
+                plot_name: loop.run_in_executor(
+                    executor,
+                    _generate_plot,
+                    {
+                        column: self._data[column]
+                        for column in _plot_columns(plot_config)
+                        if column in self._data
+                    },
+                    plot_config,
+                    self._rc_params,
+                )
+                for plot_name, plot_config in self._plots_config.items()
+            }
+            for plot_name, future in futures.items():
+                await future
+                self._log.info(f"Plot '{plot_name}' generated.")
+
+
+# dtypes of the recorded integer and boolean variables, floats are recorded with the configured dtype of the plotter
+_KIND_DTYPES = {"i": np.dtype(np.int64), "b": np.dtype(np.bool_)}
+
+
+def _value_kind(value) -> str | None:
+    """Returns "b" for booleans, "i" for integers, "f" for floats and None for values which are not numeric."""
+    if isinstance(value, (bool, np.bool_)):
+        return "b"
+    if isinstance(value, (int, np.integer)):
+        return "i"
+    if isinstance(value, (float, np.floating)):
+        return "f"
+    return None
+
+
+def _plot_columns(plot_config: dict) -> set:
+    """Returns the names of the data columns used by a plot"""
+    columns = {"time", *plot_config.get("vars", [])}
+    if "x_var" in plot_config:
+        columns.add(plot_config["x_var"])
+    if "textfield" in plot_config:
+        columns.add(plot_config["textfield"].get("var", "time"))
+    return columns
+
+
+def _generate_plot(data: dict, plot_config: dict, rc_params: dict):
+    """Generates a single plot in a worker process of Plotter.finalize"""
+    if rc_params:
+        plt.rcParams.update(rc_params)
+    PlotFactory.instantiate_plot(plot_config["type"], data, plot_config).generate()
+
+
+# factor and offset per (from, to) unit pair, a value is converted as (value + offset) * factor
+_UNIT_CONVERSIONS: dict[tuple[str, str], tuple[float, float]] = {
+    ("s", "h"): (1 / 3600, 0),
+    ("s", "d"): (1 / 86400, 0),
+    ("s", "min"): (1 / 60, 0),
+    ("C", "K"): (1, 273.15),
+    ("K", "C"): (1, -273.15),
+    ("W", "kW"): (1 / 1000, 0),
+    ("W", "MW"): (1 / 1000000, 0),
+    ("kW", "W"): (1000, 0),
+    ("MW", "W"): (1000000, 0),
+}
+# unit pairs which have already been reported as unknown
+_unknown_unit_conversions = set()
+
 
 def convert_units(data: dict, vars: list, unit_config: dict):
     """Convert units based on the provided configuration"""
@@ -107,41 +324,45 @@ def convert_units(data: dict, vars: list, unit_config: dict):
     if from_unit == to_unit:
         return data
 
-    conversion_factor = 1
-    conversion_offset = 0
-
-    if from_unit == "s" and to_unit == "h":
-        conversion_factor = 1 / 3600
-    elif from_unit == "s" and to_unit == "d":
-        conversion_factor = 1 / 86400
-    elif from_unit == "s" and to_unit == "min":
-        conversion_factor = 1 / 60
-    elif from_unit == "C" and to_unit == "K":
-        conversion_offset = 273.15
-    elif from_unit == "K" and to_unit == "C":
-        conversion_offset = -273.15
-    elif from_unit == "W" and to_unit == "kW":
-        conversion_factor = 1 / 1000
-    elif from_unit == "W" and to_unit == "MW":
-        conversion_factor = 1 / 1000000
-    elif from_unit == "kW" and to_unit == "W":
-        conversion_factor = 1000
-    elif from_unit == "MW" and to_unit == "W":
-        conversion_factor = 1000000
+    conversion = _UNIT_CONVERSIONS.get((from_unit, to_unit))
+    if conversion is None:
+        if (from_unit, to_unit) not in _unknown_unit_conversions:
+            _unknown_unit_conversions.add((from_unit, to_unit))
+            logging.getLogger(Plotter.__name__).warning(
+                f"Unknown unit conversion from '{from_unit}' to '{to_unit}', values are not converted."
+            )
+        return data
+    conversion_factor, conversion_offset = conversion
 
+    # the converted columns are new arrays, the recorded columns are shared between the plots and must not be modified in place
     for var in vars:
-        data[var] = [
-            (value + conversion_offset) * conversion_factor for value in data[var]
-        ]
+        values = np.asarray(data[var], dtype=np.float64)
+        if conversion_offset != 0:
+            values = values + conversion_offset
+        if conversion_factor != 1:
+            values = values * conversion_factor
+        data[var] = values
 
     return data
 
 
+# line styles of the plot grids
+_MAJOR_GRID_STYLE = {"which": "major", "linewidth": "0.5", "color": "black", "alpha": 0.4}
+_MINOR_GRID_STYLE = {
+    "which": "minor",
+    "linestyle": ":",
+    "linewidth": "0.5",
+    "color": "black",
+    "alpha": 0.25,
+}
+
+
 class BasePlot(ABC):
     """Base class for all plots"""
 
     def __init__(self, data, config):
-        self._data = copy(data)
+        # converted columns are written to the first map of the ChainMap, so the shared data of the plotter is never modified
+        self._data = ChainMap({}, data)
         self._title = config["title"]
         self._config = config
         self._final_time = self._data["time"][-1]
@@ -159,29 +380,27 @@ class BasePlot(ABC):
             ylabel=self._config["ylabel"],
             title=self._config["title"],
         )
-        if "grid" in self._config and self._config["grid"]:
-            ax.grid(True, which="major", linewidth="0.5", color="black", alpha=0.4)
-        if "subgrid" in self._config and self._config["subgrid"]:
+        if self._config.get("grid", False):
+            ax.grid(True, **_MAJOR_GRID_STYLE)
+        if self._config.get("subgrid", False):
             ax.minorticks_on()
-            ax.grid(
-                which="minor", linestyle=":", linewidth="0.5", color="black", alpha=0.25
-            )
+            ax.grid(**_MINOR_GRID_STYLE)
 
         # Save to merged PDF if specified
-        if "merge_pdf" in self._config and self._config["merge_pdf"] is not None:
-            self._config["merge_pdf"].savefig(fig)
+        merge_pdf = self._config.get("merge_pdf")
+        if merge_pdf is not None:
+            merge_pdf.savefig(fig)
 
         # Save individual files
+        file_name = self._title.replace(" ", "_")
         for filetype in filetypes:
-            fig.savefig(
-                self._config["path"]
-                + "/"
-                + self._title.replace(" ", "_")
-                + "."
-                + filetype
-            )
+            self._save_fig(fig, file_name + "." + filetype)
         plt.close(fig)
 
+    def _save_fig(self, fig: Figure, file_name: str):
+        """Save the figure under the given file name in the plot directory"""
+        fig.savefig(os.path.join(self._config["path"], file_name))
+
 
 class TimeSeriesPlot(BasePlot):
     """Time series plot"""
@@ -1,10 +1,12 @@
+import csv
 import os
 
+import numpy as np
 import pandas as pd
 import yaml
 from cs_fmu_mapper.components.simulation_component import SimulationComponent
 from cs_fmu_mapper.scheduler import Scheduler
-from cs_fmu_mapper.utils import chooseFile
+from cs_fmu_mapper.utils import resolveFile
 
 
 class Scenario(SimulationComponent):
@@ -15,10 +17,37 @@ class Scenario(SimulationComponent):
         self._scheduler_default_duration = config.get(
             "scheduler_default_duration", 86400
         )
+        self._csv_engine = config.get("csvEngine", "pandas")
+        if self._csv_engine == "pyarrow":
+            try:
+                import pyarrow
+            except ImportError:
+                self._log.warning(
+                    "PyArrow is not installed, falling back to pandas for reading the scenario."
+                )
+                self._csv_engine = "pandas"
         self._scenario, self._scenario_params = self._load_scenarios(
             config["path"], config.get("parameters", {})
         )
 
+        # the scenario is sorted once so that each step only has to search the time column
+        self._scenario = self._scenario.sort_values(by="t").reset_index(drop=True)
+        self._t = self._scenario["t"].to_numpy()
+        self._output_names = tuple(
+            name for name in self._output_values if name in self._scenario.columns
+        )
+        outputs = self._scenario[list(self._output_names)]
+        if outputs.dtypes.nunique() <= 1 and all(
+            pd.api.types.is_numeric_dtype(dtype) for dtype in outputs.dtypes
+        ):
+            # one contiguous row per time step holding only the configured outputs, so each step reads a single row
+            self._value_matrix = np.ascontiguousarray(outputs.to_numpy())
+            self._value_columns = None
+        else:
+            # mixed or non-numeric outputs keep their native types column by column
+            self._value_matrix = None
+            self._value_columns = [outputs[name].tolist() for name in self._output_names]
+
         self._is_finished = False
         self._progress = 0
         self._final_time = self._calculate_final_time()
@@ -83,20 +112,39 @@ class Scenario(SimulationComponent):
         return scheduler.generate_scenario()
 
     def _load_csv_scenario(self, path):
-        if os.path.exists(path):
-            if os.path.isfile(path):
-                return pd.read_csv(path)
-            elif os.path.isdir(path):
-                file = chooseFile(
-                    path,
-                    "Scenario path is a directory. Please choose a Scenario file:",
+        return self._read_csv(
+            resolveFile(
+                path,
+                "Scenario path is a directory. Please choose a Scenario file:",
+                f"Scenario file not found at: {path}",
+            )
+        )
+
+    def _read_csv(self, path):
+        """Reads a scenario CSV file with the configured engine. With the "pyarrow" engine the file is memory mapped and parsed
+        multithreaded by PyArrow. Only the time column and the columns of the configured outputs are converted, and the columns
+        are handed to pandas as numpy views of the Arrow buffers where possible."""
+        if self._csv_engine == "pyarrow":
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+
+            with open(path, newline="") as f:
+                header = next(csv.reader(f), [])
+            columns = [name for name in ("t", *self._output_values) if name in header]
+            with pa.memory_map(path, "r") as source:
+                table = pacsv.read_csv(
+                    source,
+                    convert_options=pacsv.ConvertOptions(include_columns=columns),
                 )
-                return pd.read_csv(os.path.join(path, file))
-        else:
-            raise FileNotFoundError(f"Scenario file not found at: {path}")
+            # a single chunk without nulls is converted without copying, otherwise numpy copies the chunks once
+            return pd.DataFrame(
+                {name: table.column(name).to_numpy() for name in table.column_names},
+                copy=False,
+            )
+        return pd.read_csv(path)
 
     def _calculate_final_time(self):
-        return int(self._scenario.sort_values(by="t", ascending=False).iloc[0]["t"])
+        return int(self._t[-1])
 
     def set_input_values(self, new_val):
         raise NotImplementedError("Scenario does not provide input values.")
@@ -105,30 +153,20 @@ class Scenario(SimulationComponent):
         if self._is_finished:
             return
 
-        try:
-            self._progress = t / self._final_time
-            output_values = {}
-
-            cur_val = (
-                self._scenario[self._scenario["t"] >= t]
-                .sort_values(by="t", ascending=True)
-                .iloc[0]
-            )
-            scenario_values = cur_val.to_dict()
-            del scenario_values["t"]
-            output_values.update(scenario_values)
-
-            self.set_output_values(
-                {
-                    x: output_values[x]
-                    for x in self.get_output_values().keys()
-                    if x in output_values
-                }
-            )
-        except Exception as e:
-            self._log.debug(e)
+        # a single-row scenario has a final time of 0 and is complete right away
+        self._progress = t / self._final_time if self._final_time else 1.0
+        # first row with a time greater or equal to t
+        idx = np.searchsorted(self._t, t, side="left")
+        if idx >= len(self._t):
             self._is_finished = True
             self._log.debug(f"Scenario finished at t={t}")
+            return
+
+        if self._value_matrix is not None:
+            values = self._value_matrix[idx].tolist()
+        else:
+            values = [column[idx] for column in self._value_columns]
+        self.set_output_values(dict(zip(self._output_names, values)))
 
     async def finalize(self):
         return True
@@ -4,14 +4,16 @@ from abc import ABC, abstractmethod
 
 class SimulationComponent(ABC):
 
-    @classmethod
-    def get_subclasses(cls):
-        for subclass in cls.__subclasses__():
-            if not subclass.__module__.startswith("cs_fmu_mapper.components"):
-                pass
-            else:
-                yield from subclass.get_subclasses()
-                yield subclass
+    _registry: dict[str, type] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Registers built-in components with a declared type at class definition time. Custom components are added by the ComponentFactory."""
+        super().__init_subclass__(**kwargs)
+        if (
+            cls.__module__.startswith("cs_fmu_mapper.components")
+            and getattr(cls, "type", None) is not None
+        ):
+            SimulationComponent._registry[cls.type] = cls
 
     def __init__(self, config, name):
         self._log = logging.getLogger(self.__class__.__name__)
@@ -20,25 +22,38 @@ class SimulationComponent(ABC):
         self._name: str = name
         self._is_finished: bool = True
         self._progress: float = 1
+        self._thread_safe: bool = False
+        self._blocking_step: bool = False
         self._input_values: dict[str, float] = {}
         self._output_values: dict[str, float] = {}
+        self._node_by_name: dict[str, str] = {}
+        self._input_var_names: frozenset[str] = frozenset()
+        self._output_var_names: frozenset[str] = frozenset()
 
         if "inputVar" in self._config.keys():
             self._init_input_values()
         if "outputVar" in self._config.keys():
             self._init_output_values()
 
+        # outputs first so that input variables take precedence for names used in both sections
+        for section in ("outputVar", "inputVar"):
+            if section in self._config.keys():
+                for k, v in self._config[section].items():
+                    self._node_by_name[k] = v.get("nodeID")
+
     def _init_input_values(self):
         self._input_values = {
             k: self._config["inputVar"][k]["init"]
             for k in self._config["inputVar"].keys()
         }
+        self._input_var_names = frozenset(self._input_values)
 
     def _init_output_values(self):
         self._output_values = {
             k: self._config["outputVar"][k]["init"]
             for k in self._config["outputVar"].keys()
         }
+        self._output_var_names = frozenset(self._output_values)
 
     def set_input_value(self, name, new_val):
         if not self._input_values:
@@ -80,12 +95,7 @@ class SimulationComponent(ABC):
 
     def get_node_by_name(self, name):
         """Get the nodeID for the given variable name."""
-        if self._input_values and (name in self._config["inputVar"].keys()):
-            return self._config["inputVar"][name]["nodeID"]
-        elif self._output_values and (name in self._config["outputVar"].keys()):
-            return self._config["outputVar"][name]["nodeID"]
-        else:
-            return None
+        return self._node_by_name.get(name)
 
     def get_name(self):
         return self._name
@@ -103,22 +113,26 @@ class SimulationComponent(ABC):
 
     def contains(self, name):
         """Check if the component contains a value for the given variable name."""
-        if not self._input_values and not self._output_values:
-            return False
-
-        if self._input_values and self._output_values:
-            return (
-                name in self._input_values.keys() or name in self._output_values.keys()
-            )
-        elif self._init_input_values and not self._output_values:
-            return name in self._input_values.keys()
-        elif not self._input_values and self._output_values:
-            return name in self._output_values.keys()
+        return name in self._input_var_names or name in self._output_var_names
 
     @abstractmethod
     async def do_step(self, t, dt):
         pass
 
+    def do_step_blocking(self, t, dt):
+        """Synchronous variant of do_step which may be called from a worker thread. Only used for components which are thread safe."""
+        raise NotImplementedError(
+            f"Component {self._name} does not support blocking steps."
+        )
+
+    def has_blocking_step(self):
+        """Returns True if do_step does nothing but call do_step_blocking, so callers may skip the coroutine and call do_step_blocking directly."""
+        return self._blocking_step
+
+    def is_thread_safe(self):
+        """Returns True if do_step_blocking may run concurrently to the steps of other components."""
+        return self._thread_safe
+
     def get_progress(self):
         return self._progress if not self._is_finished else 1
 
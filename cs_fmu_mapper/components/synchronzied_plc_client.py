@@ -26,6 +26,9 @@ class SynchronizedPlcClient(MasterComponent, AbstractOPCUAClient):
             self._is_finished = not self._run_inifinite
             self._progress = 0 if self._run_inifinite else 1
 
+        # number of pipelined poll requests for the step and terminate nodes, values are up to batchDepth - 1 polls old
+        self._batch_depth = config["batchDepth"] if "batchDepth" in config else 1
+
         self._k = 0
         self._n = 0
         self._s1 = 0
@@ -48,36 +51,38 @@ class SynchronizedPlcClient(MasterComponent, AbstractOPCUAClient):
 
     async def _run(self):
         await super().initialize()
-        while not self._simulationFinished:
-            curStepNodeVal = await self._stepNode.read_value()
-            terminateNodeVal = await self._terminateNode.read_value()
-
-            if terminateNodeVal or (
-                not self._run_inifinite and self._mapper.all_components_finished()
-            ):
-                self._simulationFinished = True
-            elif not self._stepNodeVal and curStepNodeVal:
-                await self.do_step()
-            self._stepNodeVal = curStepNodeVal
-
-            if self._simulationFinished:
-                await self._simulationFinishedNode.write_value(
-                    True, VariantType.Boolean
-                )
+        # the step and terminate nodes are polled together with one read request
+        polls = self._pipelined_read_values(
+            [self._stepNode, self._terminateNode], self._batch_depth
+        )
+        try:
+            async for curStepNodeVal, terminateNodeVal in polls:
+                if self._simulationFinished:
+                    break
+                if terminateNodeVal or (
+                    not self._run_inifinite and self._mapper.all_components_finished()
+                ):
+                    self._simulationFinished = True
+                elif not self._stepNodeVal and curStepNodeVal:
+                    await self.do_step()
+                self._stepNodeVal = curStepNodeVal
+
+                if self._simulationFinished:
+                    await self._simulationFinishedNode.write_value(
+                        True, VariantType.Boolean
+                    )
+                    break
+        finally:
+            await polls.aclose()
         await self.finalize()
 
     async def do_step(self, t=None, dt=None):
         self._start_time = time.time_ns()
-        for output in self.get_output_values().keys():
-            output_node = self._nodes[output]
-            self.set_output_value(output, await output_node.read_value())
+        await self.read_all_outputs()
 
         await super().do_step(None, None)
 
-        for input in self.get_input_values().keys():
-            input_node = self._nodes[input]
-            type = await input_node.read_data_type_as_variant_type()
-            await input_node.write_value(self.get_input_value(input), type)
+        await self.write_all_inputs()
 
         await self._finishedNode.write_value(True, VariantType.Boolean)
         self._calculate_periodtime_stats()
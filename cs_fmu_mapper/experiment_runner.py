@@ -12,7 +12,7 @@ import argparse
 
 import yaml
 from cs_fmu_mapper.config import ConfigurationBuilder
-from cs_fmu_mapper.main import CSFMUMapper
+from cs_fmu_mapper.main import CSFMUMapper, install_uvloop, uvloop_requested
 
 
 class ExperimentRunner:
@@ -29,6 +29,7 @@ class ExperimentRunner:
         run_file: str = "run.yaml",
         temp_dir: str = "temp",
         debug: bool = False,
+        use_uvloop: Optional[bool] = None,
     ):
         """
         Initialize the ExperimentRunner.
@@ -41,6 +42,8 @@ class ExperimentRunner:
         - `run_file` (str, optional): Name of the run configuration file. Defaults to "run.yaml".
         - `temp_dir` (str, optional): Name of temporary directory for generated configs. Defaults to "temp".
         - `debug` (bool, optional): Enable debug logging. Defaults to False.
+        - `use_uvloop` (Optional[bool], optional): Run the experiments with uvloop, overrides `use_uvloop` of the base configuration.
+                                                 Defaults to None.
         """
         self.base_config = Path(base_config)
         self.module_dir = Path(module_dir)
@@ -49,6 +52,7 @@ class ExperimentRunner:
         self.run_file = run_file
         self.temp_dir = self.experiments_dir / temp_dir
         self.debug = debug
+        self.use_uvloop = use_uvloop
 
         self.logger = logging.getLogger(self.__class__.__name__)
         self._setup_logging()
@@ -187,6 +191,34 @@ class ExperimentRunner:
             if working_dir:
                 os.chdir(original_dir)
 
+    def start(self, working_dir: Optional[Path] = None) -> Dict[str, float]:
+        """
+        Run all experiments in a new event loop. All experiments share the loop, so the `use_uvloop` key of the `General`
+        section of the base configuration decides whether it is a uvloop loop.
+
+        ### Args:
+        - `working_dir` (Optional[Path]): Working directory for experiment execution.
+                                        Defaults to None (uses current directory).
+
+        ### Returns:
+        - `Dict[str, float]`: Dictionary mapping experiment names to their execution times
+        """
+        use_uvloop = self.use_uvloop
+        if use_uvloop is None:
+            original_dir = Path.cwd()
+            if working_dir:
+                os.chdir(working_dir)
+            try:
+                config = ConfigurationBuilder(
+                    config_file_path=self.base_config, module_dir=self.module_dir
+                ).get_config()
+            finally:
+                os.chdir(original_dir)
+            use_uvloop = uvloop_requested(config)
+        if use_uvloop:
+            install_uvloop(self.logger)
+        return asyncio.run(self.run(working_dir=working_dir))
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run experiments defined in YAML configuration files")
@@ -244,6 +276,18 @@ if __name__ == "__main__":
         action="store_true",
         help="Enable debug logging",
     )
+    parser.add_argument(
+        "--uvloop",
+        action="store_true",
+        default=None,
+        help="Run the experiments with uvloop if it is installed, overrides use_uvloop of the base configuration",
+    )
+    parser.add_argument(
+        "--no-uvloop",
+        dest="uvloop",
+        action="store_false",
+        help="Run the experiments with the default event loop, overrides use_uvloop of the base configuration",
+    )
 
     args = parser.parse_args()
 
@@ -255,6 +299,7 @@ if __name__ == "__main__":
         run_file=args.run_file,
         temp_dir=args.temp_dir,
         debug=args.debug,
+        use_uvloop=args.uvloop,
     )
 
-    asyncio.run(runner.run(working_dir=args.working_dir))
+    runner.start(working_dir=args.working_dir)
@@ -15,11 +15,30 @@ from tqdm import TqdmWarning
 os.environ["FOR_DISABLE_CONSOLE_CTRL_HANDLER"] = "1"
 
 
+def uvloop_requested(config):
+    """Returns whether the `General` section of the configuration enables uvloop with `use_uvloop`."""
+    general = config["General"] if "General" in config else {}
+    return general["use_uvloop"] if "use_uvloop" in general else False
+
+
+def install_uvloop(logger):
+    """Uses uvloop's libuv based event loop for all following event loops if uvloop is installed. uvloop is not available on Windows."""
+    try:
+        import uvloop
+    except ImportError:
+        logger.warning("uvloop is not installed, using the default event loop.")
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop.")
+
+
 class CSFMUMapper:
-    def __init__(self, config_path, module_dir, debug=False):
+    def __init__(self, config_path, module_dir, debug=False, use_uvloop=None):
         self.config_path = config_path
         self.module_dir = module_dir
         self.debug = debug
+        # None leaves the choice to the use_uvloop key of the configuration
+        self.use_uvloop = use_uvloop
         self.setup_logging()
         self.logger = logging.getLogger("CSFMUMapper")
 
@@ -44,7 +63,16 @@ class CSFMUMapper:
             with suppress(asyncio.CancelledError):
                 await task
 
-    async def run(self):
+    def load_config(self):
+        self.logger.info("Reading configuration file...")
+        config = ConfigurationBuilder(
+            config_file_path=self.config_path, module_dir=self.module_dir
+        )
+        if self.debug:
+            config.save_to_yaml("debug_full_config.yaml")
+        return config.get_config()
+
+    async def run(self, config=None):
         if (
             sys.version_info[0] == 3
             and sys.version_info[1] >= 8
@@ -52,13 +80,8 @@ class CSFMUMapper:
         ):
             asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
-        self.logger.info("Reading configuration file...")
-        config = ConfigurationBuilder(
-            config_file_path=self.config_path, module_dir=self.module_dir
-        )
-        if self.debug:
-            config.save_to_yaml("debug_full_config.yaml")
-        config = config.get_config()
+        if config is None:
+            config = self.load_config()
 
         self.logger.info("Creating PLCClient, FMU Simulation and Mapper Instance...")
         master = ComponentFactory().createComponents(config)
@@ -72,6 +95,18 @@ class CSFMUMapper:
 
         self.logger.info("Graceful exit completed.")
 
+    def start(self):
+        """Reads the configuration and runs the mapper in a new event loop. The loop is a uvloop loop if `use_uvloop` is enabled
+        in the `General` section of the configuration, the `use_uvloop` argument of the constructor overrides the configuration.
+        """
+        config = self.load_config()
+        use_uvloop = (
+            self.use_uvloop if self.use_uvloop is not None else uvloop_requested(config)
+        )
+        if use_uvloop:
+            install_uvloop(self.logger)
+        asyncio.run(self.run(config))
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
@@ -96,9 +131,20 @@ if __name__ == "__main__":
         action="store_true",
         help="Save full config to debug_full_config.yaml and set logging mode to DEBUG",
     )
+    parser.add_argument(
+        "--uvloop",
+        action="store_true",
+        default=None,
+        help="Run the event loop with uvloop if it is installed, overrides use_uvloop of the configuration",
+    )
+    parser.add_argument(
+        "--no-uvloop",
+        dest="uvloop",
+        action="store_false",
+        help="Run the default event loop, overrides use_uvloop of the configuration",
+    )
 
     args = parser.parse_args()
 
-    mapper = CSFMUMapper(args.config_path, args.module_dir, args.debug)
-
-    asyncio.run(mapper.run())
+    mapper = CSFMUMapper(args.config_path, args.module_dir, args.debug, args.uvloop)
+    mapper.start()
@@ -1,4 +1,7 @@
+import asyncio
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 from cs_fmu_mapper.components.master_component import MasterComponent
 
@@ -22,6 +25,41 @@ class OPCUAFMUMapper:
             self._components[component.get_name()] = component
         self.init_node_maps()
 
+        # Jacobi coupling: all components read their inputs before the step, so thread safe components can be stepped concurrently
+        self._parallel_step = (
+            self._config["parallelStep"] if "parallelStep" in self._config else False
+        )
+        self._parallel_components = []
+        self._serial_components = [
+            component for component in self._components.values() if component != master
+        ]
+        self._executor = None
+        if self._parallel_step:
+            self._parallel_components = [
+                c for c in self._serial_components if c.is_thread_safe()
+            ]
+            self._serial_components = [
+                c for c in self._serial_components if not c.is_thread_safe()
+            ]
+            if self._parallel_components:
+                max_workers = min(
+                    len(self._parallel_components), max(1, (os.cpu_count() or 2) - 1)
+                )
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="component-step"
+                )
+                self._log.info(
+                    f"Stepping {len(self._parallel_components)} components in parallel with {max_workers} workers."
+                )
+        self._serial_steps = [
+            (c.do_step_blocking if c.has_blocking_step() else None, c)
+            for c in self._serial_components
+        ]
+        # components with an asynchronous step (e.g. OPC UA clients waiting for the network) can be awaited concurrently
+        self._concurrent_step = (
+            self._config["concurrentStep"] if "concurrentStep" in self._config else False
+        )
+
     def get_component_to_name(self, name):
         for component in self._components.values():
             if component.contains(name):
@@ -38,22 +76,45 @@ class OPCUAFMUMapper:
         self._name_component_map = dict(
             map(lambda x: (x, self.get_component_to_name(x)), names)
         )
+        # resolve the components of every mapping once, perform_mapping then only moves the values
+        self._resolved_pre_step_maps = self._resolve_maps(self._pre_step_maps)
+        self._resolved_post_step_maps = self._resolve_maps(self._post_step_maps)
+
+    def _resolve_maps(self, maps: dict):
+        """Resolves the source and destination components of the given mappings.
+
+        Args:
+            maps (dict): Mapping from source output names to lists of destination input names.
+
+        Returns:
+            list: Tuples of source component, source name and a list of (destination component, destination name) tuples.
+        """
+        return [
+            (
+                self._name_component_map[source],
+                source,
+                [
+                    (self._name_component_map[destination], destination)
+                    for destination in destinations
+                ],
+            )
+            for source, destinations in maps.items()
+        ]
 
     def all_components_finished(self):
         """Returns True if all components are finished."""
         return all(list(map(lambda x: x.is_finished(), self._components.values())))
 
-    def perform_mapping(self, maps: dict):
+    def perform_mapping(self, maps: list):
         """Maps the output values of the source component to the input values of the destination component.
         Args:
-            map (dict): A dict which contains the mappings between the output values of the source component and the input values of the destination component.
+            maps (list): The mappings between the output values of the source component and the input values of the destination component as
+            resolved by _resolve_maps.
         """
 
-        for source, destinations in maps.items():
-            source_component = self._name_component_map[source]
+        for source_component, source, destinations in maps:
             value = source_component.get_output_value(source)
-            for destination in destinations:
-                dest_component = self._name_component_map[destination]
+            for dest_component, destination in destinations:
                 dest_component.set_input_value(destination, value)
 
     async def do_step(self, t, dt):
@@ -68,21 +129,49 @@ class OPCUAFMUMapper:
         """
 
         # map pre step values
-        self.perform_mapping(maps=self._pre_step_maps)
+        self.perform_mapping(maps=self._resolved_pre_step_maps)
 
         # step all compoments which are not a plc and have a do_step method
-        for component in self._components.values():
-            if component != self._master:
-                await component.do_step(t, dt)
+        if self._executor is not None:
+            loop = asyncio.get_running_loop()
+            futures = [
+                loop.run_in_executor(
+                    self._executor, component.do_step_blocking, t, dt
+                )
+                for component in self._parallel_components
+            ]
+            await self._step_serial_components(t, dt)
+            await asyncio.gather(*futures)
+        else:
+            await self._step_serial_components(t, dt)
 
         # map post step values
-        self.perform_mapping(maps=self._post_step_maps)
+        self.perform_mapping(maps=self._resolved_post_step_maps)
 
         # notify master if scenarios are finished
         if self.all_components_finished():
             for component in self._components.values():
                 component.notify_simulation_finished()
 
+    async def _step_serial_components(self, t, dt):
+        """Steps the components which are not stepped in parallel one after another. Components with a purely synchronous step are called
+        directly without creating a coroutine. With concurrentStep the asynchronous steps are awaited together."""
+        if self._concurrent_step:
+            pending = []
+            for blocking_step, component in self._serial_steps:
+                if blocking_step is not None:
+                    blocking_step(t, dt)
+                else:
+                    pending.append(component.do_step(t, dt))
+            if pending:
+                await asyncio.gather(*pending)
+            return
+        for blocking_step, component in self._serial_steps:
+            if blocking_step is not None:
+                blocking_step(t, dt)
+            else:
+                await component.do_step(t, dt)
+
     def fmu_log_callback_wrapper(self, module, level, message):
         self._log.info(message)
 
@@ -92,6 +181,8 @@ class OPCUAFMUMapper:
         for component in self._components.values():
             if component != self._master:
                 await component.finalize()
+        if self._executor is not None:
+            self._executor.shutdown()
         self._log.info("Simulation finished.")
         return True
 
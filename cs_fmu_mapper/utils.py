@@ -1,5 +1,6 @@
 import inquirer
 import os
+import stat
 
 
 def chooseFile(path, message):
@@ -10,3 +11,17 @@ def chooseFile(path, message):
     questions = [inquirer.List("file", message=message, choices=files)]
     answers = inquirer.prompt(questions)
     return answers["file"]
+
+
+def resolveFile(path, message, not_found_message=None):
+    """Returns the given path if it is a file. If it is a directory, the user is asked to choose a file in it. The path is
+    checked with a single stat call."""
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            not_found_message or "Path does not exist: " + path
+        ) from None
+    if stat.S_ISDIR(mode):
+        return os.path.join(path, chooseFile(path, message))
+    return path
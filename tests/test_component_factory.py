@@ -0,0 +1,109 @@
+import threading
+
+import pytest
+
+from cs_fmu_mapper import component_factory
+from cs_fmu_mapper.component_factory import ComponentFactory
+from cs_fmu_mapper.components.simulation_component import SimulationComponent
+from cs_fmu_mapper.components.standalone_simulation_master import (
+    StandaloneSimulationMaster,
+)
+
+
+class Gain(SimulationComponent):
+    """Component of an installed package, it remembers the thread it was created in."""
+
+    type = "gain"
+
+    def __init__(self, config, name):
+        super().__init__(config, name)
+        self.init_thread = threading.current_thread()
+
+    async def do_step(self, t, dt):
+        pass
+
+
+class NoComponent:
+    type = "none"
+
+
+class EntryPoint:
+    """Stands in for an importlib.metadata.EntryPoint."""
+
+    def __init__(self, name, obj):
+        self.name = name
+        self.obj = obj
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        return self.obj
+
+
+@pytest.fixture
+def installed(monkeypatch):
+    """Installs entry points for the Gain and NoComponent classes."""
+    points = [EntryPoint("gain", Gain), EntryPoint("none", NoComponent)]
+
+    def entry_points(group):
+        assert group == "cs_fmu_mapper.components"
+        return points
+
+    monkeypatch.setattr(component_factory, "entry_points", entry_points)
+    component_factory._load_entry_point_components.cache_clear()
+    yield points
+    component_factory._load_entry_point_components.cache_clear()
+
+
+def create_config(gains, **general):
+    config = {
+        "General": general,
+        "Master": {"type": "standalone-master", "timeStepPerCycle": 1},
+        "Mapping": {"preStepMappings": {}, "postStepMappings": {}},
+    }
+    for name in gains:
+        config[name] = {
+            "type": "gain",
+            "inputVar": {f"{name}.u": {"init": 1.5, "nodeID": "u"}},
+            "outputVar": {f"{name}.y": {"init": 0, "nodeID": "y"}},
+        }
+    return config
+
+
+def test_components_of_installed_packages_are_created(installed):
+    master = ComponentFactory().createComponents(create_config(["G1"]))
+    assert isinstance(master, StandaloneSimulationMaster)
+    gain = master._mapper._components["G1"]
+    assert isinstance(gain, Gain)
+    assert gain.get_output_values() == {"G1.y": 0}
+    # the installed components do not leak into the registry of the built-in components
+    assert "gain" not in SimulationComponent._registry
+
+
+def test_entry_points_are_loaded_once(installed):
+    for _ in range(2):
+        ComponentFactory().createComponents(create_config(["G1"]))
+    assert [point.loads for point in installed] == [1, 1]
+
+
+def test_entry_points_which_are_no_components_are_skipped(installed, caplog):
+    config = create_config([])
+    config["N"] = {"type": "none"}
+    with pytest.raises(NotImplementedError):
+        ComponentFactory().createComponents(config)
+    assert "is not a subclass of SimulationComponent" in caplog.text
+
+
+@pytest.mark.parametrize("parallel_init", [False, True])
+def test_parallel_init(installed, parallel_init):
+    names = ["G1", "G2", "G3"]
+    master = ComponentFactory().createComponents(
+        create_config(names, parallelInit=parallel_init)
+    )
+    components = master._mapper._components
+    # the components keep the order of the configuration
+    assert list(components) == ["Master", *names]
+    main_thread = threading.main_thread()
+    assert {components[name].init_thread is main_thread for name in names} == {
+        not parallel_init
+    }
@@ -0,0 +1,165 @@
+import asyncio
+import logging
+import socket
+
+import pytest
+
+pytest.importorskip("asyncua")
+
+from asyncua import Server, ua
+
+from cs_fmu_mapper.components.external_opcua_client import ExternalOPCUAClient
+
+STEP_SIZE = 1.0
+
+# asyncua logs every request of the test server on info level
+logging.getLogger("asyncua").setLevel(logging.WARNING)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def start_server(port):
+    """Starts an external simulation which advances its time by STEP_SIZE and sets y = 2 * u whenever the step node is set."""
+    server = Server()
+    await server.init()
+    server.set_endpoint(f"opc.tcp://127.0.0.1:{port}/")
+    idx = await server.register_namespace("urn:cs-fmu-mapper:test")
+    sim = await server.nodes.objects.add_object(idx, "Sim")
+    nodes = {}
+    for name, value in (
+        ("step", ua.Variant(False, ua.VariantType.Boolean)),
+        ("terminate", ua.Variant(False, ua.VariantType.Boolean)),
+        ("run", ua.Variant(False, ua.VariantType.Boolean)),
+        ("enableStopTime", ua.Variant(False, ua.VariantType.Boolean)),
+        ("time", ua.Variant(0.0, ua.VariantType.Double)),
+        ("u", ua.Variant(0.0, ua.VariantType.Float)),
+        ("y", ua.Variant(0.0, ua.VariantType.Float)),
+    ):
+        nodes[name] = await sim.add_variable(idx, name, value)
+        await nodes[name].set_writable()
+    await server.start()
+
+    async def simulate():
+        while True:
+            if await nodes["step"].read_value():
+                # time, output and the reset of the step are written back to back, far below any publishing interval
+                time = await nodes["time"].read_value()
+                u = await nodes["u"].read_value()
+                await nodes["y"].write_value(ua.Variant(2 * u, ua.VariantType.Float))
+                await nodes["time"].write_value(time + STEP_SIZE)
+                await nodes["step"].write_value(False)
+            await asyncio.sleep(0.001)
+
+    return server, asyncio.create_task(simulate())
+
+
+async def stop_server(server, simulation):
+    simulation.cancel()
+    await server.stop()
+
+
+def create_client(port, **config):
+    config = {
+        "type": "external_opcua_client",
+        "host": "127.0.0.1",
+        "port": port,
+        "stepNodeName": "step",
+        "terminateNodeName": "terminate",
+        "runNodeName": "run",
+        "enableStopTimeNodeName": "enableStopTime",
+        "timeNodeName": "time",
+        "stepSize": STEP_SIZE,
+        "maxConnectRetries": 2,
+        "connectRetryInterval": 0.1,
+        "inputVar": {"sim.in.u": {"init": 0.0, "nodeID": "u"}},
+        "outputVar": {"sim.out.y": {"init": 0.0, "nodeID": "y"}},
+        **config,
+    }
+    return ExternalOPCUAClient(config, "Sim")
+
+
+def test_connect_step_and_finalize():
+    async def run():
+        port = free_port()
+        server, simulation = await start_server(port)
+        try:
+            client = create_client(port)
+            await client.initialize()
+            assert client.is_connected()
+            assert client.is_connected_slow()
+            client.set_input_value("sim.in.u", 1.5)
+            await client.do_step(0.0, STEP_SIZE)
+            assert client.get_output_value("sim.out.y") == pytest.approx(3.0)
+            await client.finalize()
+            assert not client.is_connected()
+            assert not client.is_connected_slow()
+        finally:
+            await stop_server(server, simulation)
+
+    asyncio.run(run())
+
+
+def test_subscribed_step_faster_than_publishing_interval():
+    async def run():
+        port = free_port()
+        server, simulation = await start_server(port)
+        try:
+            # the server sets and resets the step node within one publishing interval, so only the reset is published
+            client = create_client(
+                port, useSubscription=True, subscriptionPeriod=500, stepTimeout=5
+            )
+            await client.initialize()
+            for i in range(3):
+                await client.do_step(i * STEP_SIZE, STEP_SIZE)
+            assert await client.get_time() == pytest.approx(3 * STEP_SIZE)
+            await client.finalize()
+        finally:
+            await stop_server(server, simulation)
+
+    asyncio.run(run())
+
+
+def test_step_timeout():
+    async def run():
+        port = free_port()
+        server, simulation = await start_server(port)
+        # without the simulation nobody answers the step
+        simulation.cancel()
+        try:
+            client = create_client(port, useSubscription=True, stepTimeout=0.5)
+            await client.initialize()
+            with pytest.raises(TimeoutError):
+                await client.do_step(0.0, STEP_SIZE)
+            await client.close()
+        finally:
+            await server.stop()
+
+    asyncio.run(run())
+
+
+def test_session_context_manager():
+    async def run():
+        port = free_port()
+        server, simulation = await start_server(port)
+        try:
+            client = create_client(port)
+            async with client:
+                assert client.is_connected()
+                for i in range(2):
+                    await client.do_step(i * STEP_SIZE, STEP_SIZE)
+                assert await client.get_time() == pytest.approx(2 * STEP_SIZE)
+            assert not client.is_connected_slow()
+
+            await client.run()
+            idx = await server.get_namespace_index("urn:cs-fmu-mapper:test")
+            run_node = await server.nodes.objects.get_child([f"{idx}:Sim", f"{idx}:run"])
+            assert await run_node.read_value() is True
+            assert not client.is_connected_slow()
+        finally:
+            await stop_server(server, simulation)
+
+    asyncio.run(run())
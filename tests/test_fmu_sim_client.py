@@ -0,0 +1,88 @@
+import asyncio
+import os
+import shutil
+import sys
+
+import pytest
+
+pytest.importorskip("fmpy")
+
+from cs_fmu_mapper.components import fmu_sim_client
+from cs_fmu_mapper.components.fmu_sim_client import FMPySimClient
+
+FMU_DIR = os.path.join(os.path.dirname(__file__), "..", "example", "fmu")
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="example FMUs are built for Linux"
+)
+
+
+def create_client(fmu_name, step_size=0.01):
+    config = {
+        "type": "fmu-fmpy",
+        "path": os.path.join(FMU_DIR, fmu_name),
+        "stepSize": step_size,
+        "inputVar": {"model.in.u": {"init": 0, "nodeID": "u"}},
+        "outputVar": {"model.out.y": {"init": 0, "nodeID": "y"}},
+    }
+    return FMPySimClient(config, "Model")
+
+
+def step_response(client, n_steps, dt=0.01):
+    client.set_input_value("model.in.u", 1.0)
+    for i in range(n_steps):
+        asyncio.run(client.do_step(i * dt, dt))
+    return client.get_output_value("model.out.y")
+
+
+@pytest.mark.parametrize(
+    "fmu_name", ["Filter_Linux_FMU20.fmu", "Filter_Linux_FMU30.fmu"]
+)
+def test_step_response(fmu_name):
+    client = create_client(fmu_name)
+    y = step_response(client, 100)
+    assert 0 < y <= 1
+
+
+def test_fmi2_and_fmi3_agree():
+    y2 = step_response(create_client("Filter_Linux_FMU20.fmu"), 50)
+    y3 = step_response(create_client("Filter_Linux_FMU30.fmu"), 50)
+    assert y2 == pytest.approx(y3)
+
+
+@pytest.mark.parametrize(
+    "fmu_name", ["Filter_Linux_FMU20.fmu", "Filter_Linux_FMU30.fmu"]
+)
+def test_multiple_fmu_steps_per_cycle(fmu_name):
+    # one cycle of 0.1 with ten FMU steps equals ten cycles of 0.01
+    y_single = step_response(create_client(fmu_name), 10)
+    client = create_client(fmu_name)
+    client.set_input_value("model.in.u", 1.0)
+    asyncio.run(client.do_step(0, 0.1))
+    assert client.get_output_value("model.out.y") == pytest.approx(y_single)
+
+
+def test_total_time_per_cycle():
+    client = create_client("Filter_Linux_FMU20.fmu", step_size=0.1)
+    # int(0.3 / 0.1) truncates to 2 FMU steps, the cycle has 3
+    assert client.get_total_time_per_cycle(0.3) == pytest.approx(0.3)
+    with pytest.raises(ValueError):
+        client.get_total_time_per_cycle(0.25)
+
+
+def test_fmu_rebuilt_in_place_is_loaded_again(tmp_path):
+    path = tmp_path / "Filter.fmu"
+    shutil.copy(os.path.join(FMU_DIR, "Filter_Linux_FMU20.fmu"), path)
+    model_description, unzipdir, _ = fmu_sim_client._prepare_fmu(str(path))
+    assert model_description.fmiVersion == "2.0"
+    # the same file is shared by a second component
+    assert fmu_sim_client._prepare_fmu(str(path))[1] == unzipdir
+
+    shutil.copy(os.path.join(FMU_DIR, "Filter_Linux_FMU30.fmu"), path)
+    mtime_ns = os.stat(path).st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    rebuilt_description, rebuilt_unzipdir, _ = fmu_sim_client._prepare_fmu(str(path))
+    assert rebuilt_description.fmiVersion == "3.0"
+    assert rebuilt_unzipdir != unzipdir
+    # both extractions are removed when the process exits
+    assert {unzipdir, rebuilt_unzipdir} <= set(fmu_sim_client._extracted_dirs)
@@ -0,0 +1,35 @@
+import pytest
+
+try:
+    from cs_fmu_mapper import main
+    from cs_fmu_mapper.main import CSFMUMapper
+except ImportError as e:
+    # the configuration builder needs an omegaconf version with ListMergeMode
+    pytest.skip(f"cs_fmu_mapper.main can not be imported: {e}", allow_module_level=True)
+
+
+@pytest.mark.parametrize(
+    "config, use_uvloop, expected",
+    [
+        ({}, None, False),
+        ({"General": {"outputFolder": "results"}}, None, False),
+        ({"General": {"use_uvloop": True}}, None, True),
+        ({"General": {"use_uvloop": True}}, False, False),
+        ({"General": {"use_uvloop": False}}, True, True),
+    ],
+)
+def test_use_uvloop_from_config_with_override(monkeypatch, config, use_uvloop, expected):
+    installed = []
+    runs = []
+
+    async def run(self, config=None):
+        runs.append(config)
+
+    monkeypatch.setattr(main, "install_uvloop", lambda logger: installed.append(logger))
+    monkeypatch.setattr(CSFMUMapper, "load_config", lambda self: config)
+    monkeypatch.setattr(CSFMUMapper, "run", run)
+
+    CSFMUMapper("config.yaml", "configs", use_uvloop=use_uvloop).start()
+    assert bool(installed) == expected
+    # the configuration is read once and handed to the run
+    assert runs == [config]
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from cs_fmu_mapper.components.standalone_simulation_master import (
+    StandaloneSimulationMaster,
+)
+
+
+class Mapper:
+    """Mapper of a run with n_steps cycles, it reports its progress from the number of performed cycles."""
+
+    def __init__(self, n_steps):
+        self.n_steps = n_steps
+        self.steps = 0
+
+    async def initialize(self):
+        pass
+
+    async def finalize(self):
+        pass
+
+    async def do_step(self, t, dt):
+        self.steps += 1
+
+    def get_progress(self):
+        return self.steps / self.n_steps
+
+    def all_components_finished(self):
+        return self.steps >= self.n_steps
+
+
+@pytest.mark.parametrize("time_step", [0.01, 1.0, 60.0])
+def test_progress_bar_follows_short_runs(time_step):
+    master = StandaloneSimulationMaster(
+        {"timeStepPerCycle": time_step}, "StandaloneSimulationMaster"
+    )
+    mapper = Mapper(20)
+    master.set_mapper(mapper)
+
+    async def run():
+        await master.initialize()
+        for _ in range(10):
+            await master.do_step(None, None)
+        # the bar is updated with the progress collected before the last cycle
+        assert master._pbar.n == pytest.approx(45)
+        await master.finalize()
+        assert master._pbar.n == pytest.approx(100)
+
+    asyncio.run(run())
@@ -0,0 +1,113 @@
+import asyncio
+import logging
+import socket
+
+import pytest
+
+pytest.importorskip("asyncua")
+
+from asyncua import Server, ua
+
+from cs_fmu_mapper.components.opcua_client import AbstractOPCUAClient
+
+# asyncua logs every request of the test server on info level
+logging.getLogger("asyncua").setLevel(logging.WARNING)
+
+
+class Client(AbstractOPCUAClient):
+    """Minimal client which only connects, the PLC specific cycle is not needed to test the shared read and write path."""
+
+    def __init__(self, config):
+        self._log = logging.getLogger("Client")
+        self._config = config
+        self._input_values = {}
+        self._output_values = {}
+        super().__init__(config, "Client")
+
+    async def _run(self):
+        pass
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def start_server(port):
+    server = Server()
+    await server.init()
+    server.set_endpoint(f"opc.tcp://127.0.0.1:{port}/")
+    idx = await server.register_namespace("urn:cs-fmu-mapper:test")
+    plc = await server.nodes.objects.add_object(idx, "PLC")
+    for name, value in (
+        ("u", ua.Variant(0.0, ua.VariantType.Double)),
+        ("n", ua.Variant(0, ua.VariantType.Int16)),
+        ("y", ua.Variant(2.5, ua.VariantType.Double)),
+    ):
+        node = await plc.add_variable(ua.NodeId(name, idx), name, value)
+        await node.set_writable()
+    await server.start()
+    return server, idx
+
+
+def create_client(port, idx):
+    config = {
+        "host": "127.0.0.1",
+        "port": str(port),
+        "inputVar": {
+            "plc.in.u": {"init": 0, "nodeID": f"ns={idx};s=u"},
+            "plc.in.n": {"init": 0, "nodeID": f"ns={idx};s=n"},
+        },
+        "outputVar": {"plc.out.y": {"init": 0, "nodeID": f"ns={idx};s=y"}},
+    }
+    return Client(config)
+
+
+def test_connect_read_write():
+    async def run():
+        port = free_port()
+        server, idx = await start_server(port)
+        try:
+            client = create_client(port, idx)
+            await client._connect()
+            assert client.is_connected()
+            assert client._protocol_is_open()
+            await client.init_nodes()
+            assert client._input_variant_types == [
+                ua.VariantType.Double,
+                ua.VariantType.Int16,
+            ]
+
+            # the written variants follow the data types of the nodes, not the python types of the values
+            client._input_values.update({"plc.in.u": 1, "plc.in.n": 3})
+            await client.write_all_inputs()
+            u = await server.get_node(f"ns={idx};s=u").read_data_value()
+            n = await server.get_node(f"ns={idx};s=n").read_data_value()
+            assert u.Value == ua.Variant(1.0, ua.VariantType.Double)
+            assert n.Value == ua.Variant(3, ua.VariantType.Int16)
+
+            await client.read_all_outputs()
+            assert client._output_values["plc.out.y"] == 2.5
+
+            await client._disconnect()
+            assert not client.is_connected()
+        finally:
+            await server.stop()
+
+    asyncio.run(run())
+
+
+def test_failed_read_clears_connected():
+    async def run():
+        port = free_port()
+        server, idx = await start_server(port)
+        client = create_client(port, idx)
+        await client._connect()
+        await client.init_nodes()
+        await server.stop()
+        with pytest.raises(Exception):
+            await client.read_all_outputs()
+        assert not client.is_connected()
+
+    asyncio.run(run())
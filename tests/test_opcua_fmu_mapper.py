@@ -0,0 +1,143 @@
+import asyncio
+import os
+import threading
+
+import pytest
+
+from cs_fmu_mapper.components.simulation_component import SimulationComponent
+from cs_fmu_mapper.components.standalone_simulation_master import (
+    StandaloneSimulationMaster,
+)
+from cs_fmu_mapper.opcua_fmu_mapper import OPCUAFMUMapper
+
+
+def component_config(name, inputs=(), outputs=()):
+    return {
+        "type": "test",
+        "inputVar": {f"{name}.{var}": {"init": 0.0, "nodeID": var} for var in inputs},
+        "outputVar": {f"{name}.{var}": {"init": 0.0, "nodeID": var} for var in outputs},
+    }
+
+
+class Source(SimulationComponent):
+    """Provides the constant output y = 1.5."""
+
+    def __init__(self, name):
+        super().__init__(component_config(name, outputs=["y"]), name)
+        self.set_output_value(f"{name}.y", 1.5)
+
+    async def do_step(self, t, dt):
+        pass
+
+
+class Gain(SimulationComponent):
+    """Sets y = 2 * u with a blocking step. It remembers the threads it was stepped in and optionally waits for other components
+    at a barrier within its step."""
+
+    def __init__(self, name, thread_safe=True, barrier=None):
+        super().__init__(component_config(name, inputs=["u"], outputs=["y"]), name)
+        self._thread_safe = thread_safe
+        self._blocking_step = True
+        self.barrier = barrier
+        self.threads = set()
+
+    async def do_step(self, t, dt):
+        self.do_step_blocking(t, dt)
+
+    def do_step_blocking(self, t, dt):
+        self.threads.add(threading.current_thread())
+        if self.barrier is not None:
+            self.barrier.wait()
+        self.set_output_value(f"{self._name}.y", 2 * self.get_input_value(f"{self._name}.u"))
+
+
+def create_mapper(components, pre_step_mappings, post_step_mappings, **config):
+    master = StandaloneSimulationMaster({"timeStepPerCycle": 1}, "Master")
+    return OPCUAFMUMapper(
+        master=master,
+        component_list=[master, *components],
+        config={
+            "preStepMappings": pre_step_mappings,
+            "postStepMappings": post_step_mappings,
+            **config,
+        },
+    )
+
+
+@pytest.mark.parametrize("parallel_step", [False, True])
+def test_parallel_step(monkeypatch, parallel_step):
+    # the number of workers depends on the number of CPUs
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    # the barrier only opens if both thread safe components are stepped at the same time
+    barrier = threading.Barrier(2, timeout=5) if parallel_step else None
+    source = Source("S")
+    g1 = Gain("G1", barrier=barrier)
+    g2 = Gain("G2", barrier=barrier)
+    g3 = Gain("G3", thread_safe=False)
+    mapper = create_mapper(
+        [source, g1, g2, g3],
+        {"S.y": ["G1.u", "G2.u"]},
+        {"G1.y": ["G3.u"]},
+        parallelStep=parallel_step,
+    )
+
+    async def run():
+        for t in range(2):
+            await mapper.do_step(t, 1)
+        await mapper.finalize()
+
+    asyncio.run(run())
+    assert g1.get_output_value("G1.y") == 3.0
+    assert g2.get_output_value("G2.y") == 3.0
+    # G3 receives the output of G1 after the first step and computes its own output in the second step
+    assert g3.get_output_value("G3.y") == 6.0
+    main_thread = threading.main_thread()
+    assert g1.threads.isdisjoint({main_thread}) == parallel_step
+    assert g2.threads.isdisjoint({main_thread}) == parallel_step
+    # components which are not thread safe are always stepped in the event loop
+    assert g3.threads == {main_thread}
+
+
+class Waiter(SimulationComponent):
+    """Asynchronous component, e.g. an OPC UA client waiting for its server. It logs the start and the end of its steps and
+    optionally waits for other components at a barrier within its step."""
+
+    def __init__(self, name, log, barrier=None):
+        super().__init__(component_config(name), name)
+        self.log = log
+        self.barrier = barrier
+
+    async def do_step(self, t, dt):
+        self.log.append(f"{self._name} start")
+        if self.barrier is not None:
+            await asyncio.wait_for(self.barrier.wait(), 5)
+        await asyncio.sleep(0)
+        self.log.append(f"{self._name} end")
+
+
+@pytest.mark.parametrize("concurrent_step", [False, True])
+def test_concurrent_step(concurrent_step):
+    log = []
+
+    async def run():
+        # the barrier only opens if both asynchronous steps are awaited at the same time
+        barrier = asyncio.Barrier(2) if concurrent_step else None
+        source = Source("S")
+        gain = Gain("G", thread_safe=False)
+        mapper = create_mapper(
+            [source, Waiter("W1", log, barrier), gain, Waiter("W2", log, barrier)],
+            {"S.y": ["G.u"]},
+            {},
+            concurrentStep=concurrent_step,
+        )
+        await mapper.do_step(0, 1)
+        await mapper.finalize()
+        # synchronous steps are still performed
+        assert gain.get_output_value("G.y") == 3.0
+
+    asyncio.run(run())
+    if concurrent_step:
+        assert log[:2] == ["W1 start", "W2 start"]
+        assert sorted(log[2:]) == ["W1 end", "W2 end"]
+    else:
+        assert log == ["W1 start", "W1 end", "W2 start", "W2 end"]
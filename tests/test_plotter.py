@@ -0,0 +1,166 @@
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cs_fmu_mapper.components import plotter as plotter_module
+from cs_fmu_mapper.components.plotter import Plotter, convert_units
+
+
+def create_plotter(tmp_path, names, **config):
+    config = {
+        "type": "plotter",
+        "outputFolder": str(tmp_path),
+        "exclude_n_values": 0,
+        "inputVar": {
+            f"plot.in.{name}": {"init": 0, "nodeID": name} for name in names
+        },
+        **config,
+    }
+    return Plotter(config, "Plotter")
+
+
+def record(plotter, rows):
+    """Records one step per row, a row maps node ids to the values of the step."""
+    for i, row in enumerate(rows):
+        for name, value in row.items():
+            plotter.set_input_value(f"plot.in.{name}", value)
+        asyncio.run(plotter.do_step(i * 0.5, 0.5))
+    asyncio.run(plotter.finalize())
+    return plotter._data
+
+
+def read_csv(plotter):
+    plotter.save_data()
+    return pd.read_csv(plotter._output_path + "/data.csv")
+
+
+def test_floats_are_recorded_beyond_expected_steps(tmp_path):
+    plotter = create_plotter(tmp_path, ["x", "y"], expectedSteps=2)
+    data = record(plotter, [{"x": i * 0.1, "y": -i * 0.1} for i in range(5)])
+    assert plotter._values is not None
+    assert data["x"].tolist() == [i * 0.1 for i in range(5)]
+    assert data["y"].tolist() == [-i * 0.1 for i in range(5)]
+    assert data["time"].tolist() == [0.0, 0.5, 1.0, 1.5, 2.0]
+
+
+def test_integer_and_boolean_columns_keep_their_types(tmp_path):
+    plotter = create_plotter(tmp_path, ["x", "n", "on"])
+    data = record(
+        plotter,
+        [{"x": 0.5, "n": 1, "on": True}, {"x": 1.5, "n": 2, "on": False}],
+    )
+    assert data["n"].dtype == np.int64
+    assert data["on"].dtype == np.bool_
+    csv = read_csv(plotter)
+    assert csv["n"].tolist() == [1, 2]
+    assert csv["n"].dtype == np.int64
+    assert csv["on"].tolist() == [True, False]
+
+
+def test_integer_column_is_promoted_by_floats(tmp_path):
+    # the first step usually records the integer init values of the configuration
+    plotter = create_plotter(tmp_path, ["x"])
+    data = record(plotter, [{"x": 0}, {"x": 0.25}, {"x": 2}])
+    assert plotter._values is not None
+    assert data["x"].tolist() == [0.0, 0.25, 2.0]
+
+
+@pytest.mark.parametrize("value", [None, "on"])
+def test_non_numeric_values_are_recorded_as_they_are(tmp_path, value):
+    plotter = create_plotter(tmp_path, ["x", "s"])
+    data = record(
+        plotter,
+        [{"x": 0.5, "s": 1}, {"x": 1.5, "s": value}, {"x": 2.5, "s": 3}],
+    )
+    assert plotter._values is None
+    assert data["x"] == [0.5, 1.5, 2.5]
+    assert data["s"] == [1, value, 3]
+
+
+def test_dtype_only_applies_to_float_columns(tmp_path):
+    plotter = create_plotter(tmp_path, ["x", "n"], dtype="float32")
+    # 2**24 + 1 is the smallest integer float32 can not represent
+    data = record(plotter, [{"x": 0.5, "n": 2**24 + 1}, {"x": 1.5, "n": 3}])
+    assert data["x"].dtype == np.float32
+    assert data["n"].dtype == np.int64
+    assert data["n"].tolist() == [2**24 + 1, 3]
+    assert data["time"].dtype == np.float64
+
+
+@pytest.mark.parametrize(
+    "from_unit, to_unit, expected",
+    [
+        ("s", "h", [0.0, 1.0, 2.5]),
+        ("s", "min", [0.0, 60.0, 150.0]),
+        ("C", "K", [273.15, 3873.15, 9273.15]),
+        ("K", "C", [-273.15, 3326.85, 8726.85]),
+        ("W", "kW", [0.0, 3.6, 9.0]),
+        ("kW", "W", [0.0, 3600000.0, 9000000.0]),
+    ],
+)
+def test_convert_units(from_unit, to_unit, expected):
+    values = np.array([0.0, 3600.0, 9000.0])
+    data = {"x": values, "y": [1.0, 2.0, 3.0]}
+    converted = convert_units(data, ["x"], {"from": from_unit, "to": to_unit})
+    assert converted["x"] == pytest.approx(expected)
+    assert converted["y"] == [1.0, 2.0, 3.0]
+    # the recorded column is replaced, not modified in place
+    assert values.tolist() == [0.0, 3600.0, 9000.0]
+
+
+def test_unknown_unit_conversion_warns_once(monkeypatch, caplog):
+    monkeypatch.setattr(plotter_module, "_unknown_unit_conversions", set())
+    data = {"x": [1.0, 2.0]}
+    for _ in range(2):
+        assert convert_units(data, ["x"], {"from": "bar", "to": "Pa"})["x"] == [1.0, 2.0]
+    warnings = [r for r in caplog.records if "Unknown unit conversion" in r.getMessage()]
+    assert len(warnings) == 1
+
+
+def plots_config():
+    return {
+        "x over time": {
+            "type": "time_series",
+            "vars": ["x"],
+            "title": "x over time",
+            "xlabel": "t in min",
+            "ylabel": "x",
+            "xUnit": {"from": "s", "to": "min"},
+        },
+        "y over x": {
+            "type": "scatter",
+            "x_var": "x",
+            "vars": ["y"],
+            "title": "y over x",
+            "xlabel": "x",
+            "ylabel": "y in kW",
+            "yUnit": {"from": "W", "to": "kW"},
+        },
+    }
+
+
+@pytest.mark.parametrize("parallel_plots", [False, True])
+def test_plots_are_generated(tmp_path, parallel_plots):
+    plotter = create_plotter(
+        tmp_path, ["x", "y"], plots=plots_config(), parallelPlots=parallel_plots
+    )
+    data = record(plotter, [{"x": i * 0.1, "y": i * 100.0} for i in range(5)])
+    assert sorted(p.name for p in (tmp_path / "plots").iterdir()) == [
+        "x_over_time.pdf",
+        "y_over_x.pdf",
+    ]
+    assert (tmp_path / "data.csv").exists()
+    # the unit conversions of the plots do not change the recorded data
+    assert data["y"].tolist() == [i * 100.0 for i in range(5)]
+    assert data["time"].tolist() == [0.0, 0.5, 1.0, 1.5, 2.0]
+
+
+def test_merged_plots_are_generated_with_parallel_plots(tmp_path):
+    plotter = create_plotter(
+        tmp_path, ["x", "y"], plots=plots_config(), parallelPlots=True, mergePlot=True
+    )
+    record(plotter, [{"x": i * 0.1, "y": i * 100.0} for i in range(5)])
+    assert (tmp_path / "merged_plots.pdf").exists()
+    assert len(list((tmp_path / "plots").iterdir())) == 2
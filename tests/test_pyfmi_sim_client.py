@@ -0,0 +1,133 @@
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from cs_fmu_mapper.components.fmu_sim_client import PyFMISimClient
+
+# data type constants as defined by pyfmi.fmi
+FMI2_REAL = 0
+FMI2_INTEGER = 1
+FMI2_BOOLEAN = 2
+FMI2_STRING = 3
+FMI2_ENUM = 4
+
+
+class FakeModel:
+    """Stands in for a PyFMI FMUModelCS2. Records the typed set calls and answers typed get calls from its values."""
+
+    variables = {
+        "u": (FMI2_REAL, 1),
+        "k": (FMI2_INTEGER, 2),
+        "mode": (FMI2_ENUM, 3),
+        "on": (FMI2_BOOLEAN, 4),
+        "y": (FMI2_REAL, 5),
+        "state": (FMI2_ENUM, 6),
+    }
+
+    def __init__(self):
+        self.values = {1: 0.0, 2: 0, 3: 1, 4: False, 5: 0.5, 6: 2}
+        self.calls = []
+
+    def set_additional_logger(self, logger):
+        pass
+
+    def initialize(self):
+        pass
+
+    def get_variable_data_type(self, name):
+        return self.variables[name][0]
+
+    def get_variable_valueref(self, name):
+        return self.variables[name][1]
+
+    def _set(self, function_name, vrs, values):
+        self.calls.append((function_name, list(vrs)))
+        self.values.update(zip(vrs.tolist(), values))
+
+    def _get(self, function_name, vrs):
+        self.calls.append((function_name, list(vrs)))
+        return np.array([self.values[vr] for vr in vrs.tolist()])
+
+    def set_real(self, vrs, values):
+        self._set("set_real", vrs, values)
+
+    def set_integer(self, vrs, values):
+        self._set("set_integer", vrs, values)
+
+    def set_boolean(self, vrs, values):
+        self._set("set_boolean", vrs, values)
+
+    def get_real(self, vrs):
+        return self._get("get_real", vrs)
+
+    def get_integer(self, vrs):
+        return self._get("get_integer", vrs)
+
+    def do_step(self, t, dt, new_step):
+        self.calls.append(("do_step", [t, dt]))
+
+
+@pytest.fixture
+def pyfmi(monkeypatch):
+    fmi = types.ModuleType("pyfmi.fmi")
+    fmi.FMI2_REAL = FMI2_REAL
+    fmi.FMI2_INTEGER = FMI2_INTEGER
+    fmi.FMI2_BOOLEAN = FMI2_BOOLEAN
+    fmi.FMI2_STRING = FMI2_STRING
+    fmi.FMI2_ENUM = FMI2_ENUM
+    fmi.FMUModelCS2 = FakeModel
+    package = types.ModuleType("pyfmi")
+    package.fmi = fmi
+    package.load_fmu = lambda path: FakeModel()
+    monkeypatch.setitem(sys.modules, "pyfmi", package)
+    monkeypatch.setitem(sys.modules, "pyfmi.fmi", fmi)
+
+
+def create_client(tmp_path):
+    path = tmp_path / "model.fmu"
+    path.touch()
+    config = {
+        "type": "fmu-pyfmi",
+        "path": str(path),
+        "stepSize": 0.1,
+        "inputVar": {
+            "model.in.u": {"init": 0.0, "nodeID": "u"},
+            "model.in.mode": {"init": 0, "nodeID": "mode"},
+            "model.in.k": {"init": 0, "nodeID": "k"},
+            "model.in.on": {"init": False, "nodeID": "on"},
+        },
+        "outputVar": {
+            "model.out.y": {"init": 0.0, "nodeID": "y"},
+            "model.out.state": {"init": 0, "nodeID": "state"},
+        },
+    }
+    return PyFMISimClient(config, "Model")
+
+
+def test_variables_are_grouped_by_type(pyfmi, tmp_path):
+    client = create_client(tmp_path)
+    client.set_input_value("model.in.u", 1.5)
+    client.set_input_value("model.in.mode", 3)
+    client.set_input_value("model.in.k", 7)
+    client.set_input_value("model.in.on", True)
+    client.do_step_blocking(0.0, 0.1)
+
+    model = client._model
+    # enumerations are transferred with the integer functions, one call per data type
+    assert model.calls == [
+        ("set_real", [1]),
+        ("set_integer", [3]),
+        ("set_integer", [2]),
+        ("set_boolean", [4]),
+        ("do_step", [0.0, 0.1]),
+        ("get_real", [5]),
+        ("get_integer", [6]),
+    ]
+    assert model.values[1] == 1.5
+    assert model.values[3] == 3
+    assert model.values[2] == 7
+    assert model.values[4] is True
+    assert client.get_output_value("model.out.y") == 0.5
+    assert client.get_output_value("model.out.state") == 2
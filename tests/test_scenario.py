@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from cs_fmu_mapper.components.scenario import Scenario
+
+
+def write_csv(tmp_path, text, name="scenario.csv"):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+
+def create_scenario(path, outputs, **config):
+    config = {
+        "type": "scenario",
+        "path": path,
+        "outputVar": {name: {"init": 0, "nodeID": name} for name in outputs},
+        **config,
+    }
+    return Scenario(config, "Scenario")
+
+
+def step(scenario, t):
+    asyncio.run(scenario.do_step(t, 1))
+    return dict(scenario.get_output_values())
+
+
+def test_pyarrow_engine_reads_only_configured_columns(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = write_csv(tmp_path, "t,a,unused,b\n0,1.5,x,10\n5,2.5,y,20\n")
+    scenario = create_scenario(path, ["a", "b"], csvEngine="pyarrow")
+    assert scenario._csv_engine == "pyarrow"
+    assert list(scenario._scenario.columns) == ["t", "a", "b"]
+    assert step(scenario, 3) == {"a": 2.5, "b": 20}
+
+
+def test_pyarrow_engine_matches_pandas(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = write_csv(tmp_path, "t,a,b\n0,1.5,1\n2,2.5,2\n4,3.5,3\n")
+    pandas = create_scenario(path, ["a", "b"])
+    pyarrow = create_scenario(path, ["a", "b"], csvEngine="pyarrow")
+    for t in (0, 1, 2, 3, 4):
+        assert step(pyarrow, t) == step(pandas, t)
+
+
+def test_step_uses_first_row_at_or_after_time(tmp_path):
+    # the rows are deliberately unsorted
+    path = write_csv(tmp_path, "t,a\n10,3.0\n0,1.0\n5,2.0\n")
+    scenario = create_scenario(path, ["a"])
+    assert step(scenario, 0) == {"a": 1.0}
+    assert step(scenario, 0.5) == {"a": 2.0}
+    assert step(scenario, 5) == {"a": 2.0}
+    assert step(scenario, 7.5) == {"a": 3.0}
+    assert scenario.get_progress() == 0.75
+    assert step(scenario, 10) == {"a": 3.0}
+    assert not scenario.is_finished()
+
+
+def test_scenario_is_finished_after_last_row(tmp_path):
+    path = write_csv(tmp_path, "t,a\n0,1.0\n5,2.0\n")
+    scenario = create_scenario(path, ["a"])
+    step(scenario, 5)
+    assert not scenario.is_finished()
+    # the last values are kept once the scenario is finished
+    assert step(scenario, 6) == {"a": 2.0}
+    assert scenario.is_finished()
+    assert step(scenario, 0) == {"a": 2.0}
+
+
+def test_only_configured_outputs_are_set(tmp_path):
+    path = write_csv(tmp_path, "t,a,b\n0,1.0,10.0\n5,2.0,20.0\n")
+    scenario = create_scenario(path, ["b"])
+    assert step(scenario, 1) == {"b": 20.0}
+
+
+def test_single_row_scenario(tmp_path):
+    path = write_csv(tmp_path, "t,a\n0,1.0\n")
+    scenario = create_scenario(path, ["a"])
+    assert step(scenario, 0) == {"a": 1.0}
+    assert scenario.get_progress() == 1.0
+    step(scenario, 1)
+    assert scenario.is_finished()
+
+
+def test_numeric_outputs_of_one_dtype_use_the_value_matrix(tmp_path):
+    path = write_csv(tmp_path, "t,a,b\n0,1.5,2.5\n5,3.5,4.5\n")
+    scenario = create_scenario(path, ["a", "b"])
+    assert scenario._value_matrix is not None
+    values = step(scenario, 5)
+    assert values == {"a": 3.5, "b": 4.5}
+    assert all(type(value) is float for value in values.values())
+
+
+def test_integer_outputs_stay_integers(tmp_path):
+    path = write_csv(tmp_path, "t,n,m\n0,1,2\n5,3,4\n")
+    scenario = create_scenario(path, ["n", "m"])
+    values = step(scenario, 5)
+    assert values == {"n": 3, "m": 4}
+    assert all(type(value) is int for value in values.values())
+
+
+def test_mixed_outputs_keep_their_types(tmp_path):
+    path = write_csv(
+        tmp_path, "t,x,n,on,mode\n0,0.5,1,True,auto\n5,1.5,2,False,manual\n"
+    )
+    scenario = create_scenario(path, ["x", "n", "on", "mode"])
+    assert scenario._value_matrix is None
+    values = step(scenario, 5)
+    assert values == {"x": 1.5, "n": 2, "on": False, "mode": "manual"}
+    assert [type(value) for value in values.values()] == [float, int, bool, str]